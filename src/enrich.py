@@ -44,9 +44,41 @@ import time
 # Add Python IANA time zone ultilities for integration
 from zoneinfo import ZoneInfo
 
+# Add Python NumPy libraries for integration
+import numpy as np
+
 # Add Python Pandas libraries for integration
 import pandas as pd
 
+# Define positional fields extracted from TikTok Ads campaign_name
+ENRICH_CAMPAIGN_FIELDS = (
+    ("enrich_campaign_objective", 0),
+    ("enrich_campaign_region", 1),
+    ("enrich_budget_group", 2),
+    ("enrich_budget_type", 3),
+    ("enrich_category_group", 4),
+    ("enrich_campaign_personnel", 5),
+    ("enrich_program_track", 7),
+    ("enrich_program_group", 8),
+    ("enrich_program_type", 9),
+)
+
+# Define positional fields extracted from TikTok Ads adgroup_name
+ENRICH_ADSET_FIELDS = (
+    ("enrich_adset_location", 0),
+    ("enrich_adset_audience", 1),
+    ("enrich_adset_format", 2),
+    ("enrich_adset_strategy", 3),
+    ("enrich_adset_subtype", 4),
+)
+
+# Define fallback value for naming convention fields that cannot be extracted
+ENRICH_VALUE_UNKNOWN = "unknown"
+
+# Define compiled table naming convention patterns for TikTok Ads raw tables
+ENRICH_CAMPAIGN_TABLE_PATTERN = re.compile(r"^(?P<company>\w+)_table_(?P<platform>\w+)_(?P<department>\w+)_(?P<account>\w+)_campaign_m\d{6}$")
+ENRICH_AD_TABLE_PATTERN = re.compile(r"^(?P<company>\w+)_table_(?P<platform>\w+)_(?P<department>\w+)_(?P<account>\w+)_ad_m\d{6}$")
+
 # 1. ENRICH TIKTOK INSIGHTS
 
 # 1.1. Enrich TikTok Ads campaign insights
@@ -59,8 +91,10 @@ def enrich_campaign_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str)
     enrich_time_start = time.time()   
     enrich_sections_status = {}
     enrich_sections_time = {}
-    print(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads campaign insights for {len(enrich_df_input)} row(s) at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
-    logging.info(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads campaign insights for {len(enrich_df_input)} row(s) at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
+    enrich_rows_input = len(enrich_df_input)
+    enrich_time_started = datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")
+    print(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads campaign insights for {enrich_rows_input} row(s) at {enrich_time_started}...")
+    logging.info(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads campaign insights for {enrich_rows_input} row(s) at {enrich_time_started}...")
 
     try:
 
@@ -83,15 +117,14 @@ def enrich_campaign_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str)
         enrich_section_name = "[ENRICH] Enrich table fields for TikTok Ads campaign insights"
         enrich_section_start = time.time()            
         try: 
-            print(f"🔍 [ENRICH] Enriching table fields for TikTok Ads campaign insights with {len(enrich_df_input)} row(s)...")
-            logging.info(f"🔍 [ENRICH] Enriching table fields for TikTok Ads campaign insights with {len(enrich_df_input)} row(s)...")
-            enrich_df_table = enrich_df_input.copy()    
-            enrich_table_name = enrich_table_id.split(".")[-1]
-            enrich_table_convention = re.search(r"^(?P<company>\w+)_table_(?P<platform>\w+)_(?P<department>\w+)_(?P<account>\w+)_campaign_m\d{6}$",enrich_table_name)            
-            enrich_df_table = enrich_df_table.assign(
-                enrich_account_platform=enrich_table_convention.group("platform") if enrich_table_convention else "unknown",
-                enrich_account_department=enrich_table_convention.group("department") if enrich_table_convention else "unknown",
-                enrich_account_name=enrich_table_convention.group("account") if enrich_table_convention else "unknown"
+            print(f"🔍 [ENRICH] Enriching table fields for TikTok Ads campaign insights with {enrich_rows_input} row(s)...")
+            logging.info(f"🔍 [ENRICH] Enriching table fields for TikTok Ads campaign insights with {enrich_rows_input} row(s)...")
+            enrich_table_name = enrich_table_id.rpartition(".")[2]
+            enrich_table_convention = ENRICH_CAMPAIGN_TABLE_PATTERN.match(enrich_table_name)
+            enrich_df_table = enrich_df_input.assign(
+                enrich_account_platform=enrich_table_field(enrich_table_convention.group("platform") if enrich_table_convention else ENRICH_VALUE_UNKNOWN, enrich_rows_input),
+                enrich_account_department=enrich_table_field(enrich_table_convention.group("department") if enrich_table_convention else ENRICH_VALUE_UNKNOWN, enrich_rows_input),
+                enrich_account_name=enrich_table_field(enrich_table_convention.group("account") if enrich_table_convention else ENRICH_VALUE_UNKNOWN, enrich_rows_input)
             )            
             enrich_sections_status[enrich_section_name] = "succeed"            
             print(f"✅ [ENRICH] Successfully enriched table fields for TikTok Ads campaign insights with {len(enrich_df_table)} row(s).")
@@ -109,21 +142,7 @@ def enrich_campaign_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str)
         try:
             print(f"🔍 [ENRICH] Enriching campaign fields for TikTok Ads campaign insights with {len(enrich_df_table)} row(s)...")
             logging.info(f"🔍 [ENRICH] Enriching campaign fields for TikTok Ads campaign insights with {len(enrich_df_table)} row(s)...")
-            enrich_df_campaign = enrich_df_table.copy()
-            enrich_df_campaign = (
-                enrich_df_campaign
-                .assign(
-                    enrich_campaign_objective=lambda df: df["campaign_name"].str.split("_").str[0].fillna("unknown"),
-                    enrich_campaign_region=lambda df: df["campaign_name"].str.split("_").str[1].fillna("unknown"),
-                    enrich_budget_group=lambda df: df["campaign_name"].str.split("_").str[2].fillna("unknown"),
-                    enrich_budget_type=lambda df: df["campaign_name"].str.split("_").str[3].fillna("unknown"),
-                    enrich_category_group=lambda df: df["campaign_name"].str.split("_").str[4].fillna("unknown"),
-                    enrich_campaign_personnel=lambda df: df["campaign_name"].str.split("_").str[5].fillna("unknown"),
-                    enrich_program_track=lambda df: df["campaign_name"].str.split("_").str[7].fillna("unknown"),
-                    enrich_program_group=lambda df: df["campaign_name"].str.split("_").str[8].fillna("unknown"),
-                    enrich_program_type=lambda df: df["campaign_name"].str.split("_").str[9].fillna("unknown"),
-                )
-            )       
+            enrich_df_campaign = pd.concat([enrich_df_table, enrich_naming_fields(enrich_df_table["campaign_name"], ENRICH_CAMPAIGN_FIELDS)], axis=1)
             enrich_sections_status[enrich_section_name] = "succeed"            
             print(f"✅ [ENRICH] Successfully enriched campaign fields for TikTok Ads campaign insights with {len(enrich_df_campaign)} row(s).")
             logging.info(f"✅ [ENRICH] Successfully enriched campaign fields for TikTok Ads campaign insights with {len(enrich_df_campaign)} row(s).")            
@@ -140,12 +159,9 @@ def enrich_campaign_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str)
         try:
             print(f"🔍 [ENRICH] Enriching date fields for TikTok Ads campaign insights with {len(enrich_df_campaign)} row(s)...")
             logging.info(f"🔍 [ENRICH] Enriching date fields for TikTok Ads campaign insights with {len(enrich_df_campaign)} row(s)...")
-            enrich_df_other = enrich_df_campaign.copy()
-            enrich_df_other = enrich_df_other.rename(columns={"stat_time_day": "date_start"})
+            enrich_df_other = enrich_df_campaign.rename(columns={"stat_time_day": "date_start"})
             enrich_df_other = enrich_df_other.assign(
-                date=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.floor("D"),
-                year=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.strftime("%Y"),
-                month=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.strftime("%Y-%m"),
+                **enrich_date_fields(enrich_df_other["date_start"]),
                 last_updated_at=lambda _: datetime.utcnow().replace(tzinfo=pytz.UTC),
             ).drop(columns=["date_start"], errors="ignore")
             enrich_sections_status[enrich_section_name] = "succeed"
@@ -161,11 +177,10 @@ def enrich_campaign_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str)
     # 1.1.6. Summarize enrichment results for TikTok campaign insights
     finally:
         enrich_time_elapsed = round(time.time() - enrich_time_start, 2)
-        enrich_df_final = enrich_df_other.copy() if not enrich_df_other.empty else pd.DataFrame()
+        enrich_df_final = enrich_df_other if "enrich_df_other" in locals() and not enrich_df_other.empty else pd.DataFrame()
         enrich_sections_total = len(enrich_sections_status)
         enrich_sections_failed = [k for k, v in enrich_sections_status.items() if v == "failed"]
         enrich_sections_succeeded = [k for k, v in enrich_sections_status.items() if v == "succeed"]
-        enrich_rows_input = len(enrich_df_input)
         enrich_rows_output = len(enrich_df_final)
         enrich_sections_summary = list(dict.fromkeys(
             list(enrich_sections_status.keys()) +
@@ -215,8 +230,10 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
     enrich_time_start = time.time()   
     enrich_sections_status = {}
     enrich_sections_time = {}
-    print(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads ad insights for {len(enrich_df_input)} row(s) at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
-    logging.info(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads ad insights for {len(enrich_df_input)} row(s) at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
+    enrich_rows_input = len(enrich_df_input)
+    enrich_time_started = datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")
+    print(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads ad insights for {enrich_rows_input} row(s) at {enrich_time_started}...")
+    logging.info(f"🔍 [ENRICH] Proceeding to enrich TikTok Ads ad insights for {enrich_rows_input} row(s) at {enrich_time_started}...")
 
     try:
 
@@ -239,16 +256,15 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
         enrich_section_name = "[ENRICH] Enrich table fields for TikTok Ads ad insights"
         enrich_section_start = time.time()   
         try:
-            print(f"🔍 [ENRICH] Enriching table fields for TikTok Ads ad insights with {len(enrich_df_input)} row(s)...")
-            logging.info(f"🔍 [ENRICH] Enriching table fields for TikTok Ads ad insights with {len(enrich_df_input)} row(s)...")
-            enrich_df_table = enrich_df_input.copy()
-            enrich_table_name = enrich_table_id.split(".")[-1]
-            enrich_table_convention = re.search(r"^(?P<company>\w+)_table_(?P<platform>\w+)_(?P<department>\w+)_(?P<account>\w+)_ad_m\d{6}$", enrich_table_name)
-            enrich_df_table = enrich_df_table.assign(
+            print(f"🔍 [ENRICH] Enriching table fields for TikTok Ads ad insights with {enrich_rows_input} row(s)...")
+            logging.info(f"🔍 [ENRICH] Enriching table fields for TikTok Ads ad insights with {enrich_rows_input} row(s)...")
+            enrich_table_name = enrich_table_id.rpartition(".")[2]
+            enrich_table_convention = ENRICH_AD_TABLE_PATTERN.match(enrich_table_name)
+            enrich_df_table = enrich_df_input.assign(
                 spend=lambda df: pd.to_numeric(df["spend"], errors="coerce").fillna(0),
-                enrich_account_platform=enrich_table_convention.group("platform") if enrich_table_convention else None,
-                enrich_account_department=enrich_table_convention.group("department") if enrich_table_convention else None,
-                enrich_account_name=enrich_table_convention.group("account") if enrich_table_convention else None
+                enrich_account_platform=enrich_table_field(enrich_table_convention.group("platform") if enrich_table_convention else None, enrich_rows_input),
+                enrich_account_department=enrich_table_field(enrich_table_convention.group("department") if enrich_table_convention else None, enrich_rows_input),
+                enrich_account_name=enrich_table_field(enrich_table_convention.group("account") if enrich_table_convention else None, enrich_rows_input)
             )
             enrich_sections_status[enrich_section_name] = "succeed"
             print(f"✅ [ENRICH] Successfully enriched table fields for TikTok Ads ad insights with {len(enrich_df_table)} row(s).")
@@ -266,21 +282,7 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
         try:
             print(f"🔍 [ENRICH] Enriching campaign fields for TikTok Ads ad insights with {len(enrich_df_table)} row(s)...")
             logging.info(f"🔍 [ENRICH] Enriching campaign fields for TikTok Ads ad insights with {len(enrich_df_table)} row(s)...")
-            enrich_df_campaign = enrich_df_table.copy()
-            enrich_df_campaign = (
-                enrich_df_campaign
-                .assign(
-                    enrich_campaign_objective=lambda df: df["campaign_name"].str.split("_").str[0].fillna("unknown"),
-                    enrich_campaign_region=lambda df: df["campaign_name"].str.split("_").str[1].fillna("unknown"),
-                    enrich_budget_group=lambda df: df["campaign_name"].str.split("_").str[2].fillna("unknown"),
-                    enrich_budget_type=lambda df: df["campaign_name"].str.split("_").str[3].fillna("unknown"),
-                    enrich_category_group=lambda df: df["campaign_name"].str.split("_").str[4].fillna("unknown"),
-                    enrich_campaign_personnel=lambda df: df["campaign_name"].str.split("_").str[5].fillna("unknown"),
-                    enrich_program_track=lambda df: df["campaign_name"].str.split("_").str[7].fillna("unknown"),
-                    enrich_program_group=lambda df: df["campaign_name"].str.split("_").str[8].fillna("unknown"),
-                    enrich_program_type=lambda df: df["campaign_name"].str.split("_").str[9].fillna("unknown"),
-                )
-            )
+            enrich_df_campaign = pd.concat([enrich_df_table, enrich_naming_fields(enrich_df_table["campaign_name"], ENRICH_CAMPAIGN_FIELDS)], axis=1)
             enrich_sections_status[enrich_section_name] = "succeed"
             print(f"✅ [ENRICH] Successfully enriched campaign fields for TikTok Ads ad insights with {len(enrich_df_campaign)} row(s).")
             logging.info(f"✅ [ENRICH] Successfully enriched campaign fields for TikTok Ads ad insights with {len(enrich_df_campaign)} row(s).")           
@@ -297,14 +299,7 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
         try:
             print(f"🔍 [ENRICH] Enriching adset fields for TikTok Ads ad insights with {len(enrich_df_campaign)} row(s)...")
             logging.info(f"🔍 [ENRICH] Enriching adset fields for TikTok Ads ad insights with {len(enrich_df_campaign)} row(s)...")
-            enrich_df_adset = enrich_df_campaign.copy()
-            enrich_df_adset = enrich_df_adset.assign(
-                enrich_adset_location=lambda df: df["adgroup_name"].fillna("").str.split("_").str[0].fillna("unknown"),
-                enrich_adset_audience=lambda df: df["adgroup_name"].fillna("").str.split("_").str[1].fillna("unknown"),
-                enrich_adset_format=lambda df: df["adgroup_name"].fillna("").str.split("_").str[2].fillna("unknown"),
-                enrich_adset_strategy=lambda df: df["adgroup_name"].fillna("").str.split("_").str[3].fillna("unknown"),
-                enrich_adset_subtype=lambda df: df["adgroup_name"].fillna("").str.split("_").str[4].fillna("unknown")
-            )
+            enrich_df_adset = pd.concat([enrich_df_campaign, enrich_naming_fields(enrich_df_campaign["adgroup_name"], ENRICH_ADSET_FIELDS)], axis=1)
             enrich_sections_status[enrich_section_name] = "succeed"
             print(f"✅ [ENRICH] Successfully enriched adset fields for TikTok Ads ad insights with {len(enrich_df_adset)} row(s).")
             logging.info(f"✅ [ENRICH] Successfully enriched adset fields for TikTok Ads ad insights with {len(enrich_df_adset)} row(s).")            
@@ -321,12 +316,9 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
         try:
             print(f"🔍 [ENRICH] Enriching date fields for TikTok Ads ad insights with {len(enrich_df_adset)} row(s)...")
             logging.info(f"🔍 [ENRICH] Enriching date fields for TikTok Ads ad insights with {len(enrich_df_adset)} row(s)...")
-            enrich_df_other = enrich_df_adset.copy()
-            enrich_df_other = enrich_df_other.rename(columns={"stat_time_day": "date_start"})
+            enrich_df_other = enrich_df_adset.rename(columns={"stat_time_day": "date_start"})
             enrich_df_other = enrich_df_other.assign(
-                date=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.floor("D"),
-                year=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.strftime("%Y"),
-                month=lambda df: pd.to_datetime(df["date_start"], errors="coerce", utc=True).dt.strftime("%Y-%m"),
+                **enrich_date_fields(enrich_df_other["date_start"]),
                 last_updated_at=lambda _: datetime.utcnow().replace(tzinfo=pytz.UTC),
             ).drop(columns=["date_start"], errors="ignore")
             enrich_sections_status[enrich_section_name] = "succeed"
@@ -342,11 +334,10 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
     # 1.2.7. Summarize enrich results for TikTok ad insights
     finally:
         enrich_time_elapsed = round(time.time() - enrich_time_start, 2)
-        enrich_df_final = enrich_df_other.copy() if not enrich_df_other.empty else pd.DataFrame()
+        enrich_df_final = enrich_df_other if "enrich_df_other" in locals() and not enrich_df_other.empty else pd.DataFrame()
         enrich_sections_total = len(enrich_sections_status)
         enrich_sections_failed = [k for k, v in enrich_sections_status.items() if v == "failed"]
         enrich_sections_succeeded = [k for k, v in enrich_sections_status.items() if v == "succeed"]
-        enrich_rows_input = len(enrich_df_input)
         enrich_rows_output = len(enrich_df_final)
         enrich_sections_summary = list(dict.fromkeys(
             list(enrich_sections_status.keys()) +
@@ -384,4 +375,60 @@ def enrich_ad_fields(enrich_df_input: pd.DataFrame, enrich_table_id: str) -> pd.
                 "enrich_rows_output": enrich_rows_output,
             },
         }    
-    return enrich_results_final
\ No newline at end of file
+    return enrich_results_final
+
+# 2. ENRICH TIKTOK ADS NAMING CONVENTION
+
+# 2.1. Split TikTok Ads naming convention into positional fields
+def enrich_naming_fields(enrich_series_input: pd.Series, enrich_fields_mapping: tuple) -> pd.DataFrame:
+    if enrich_series_input.empty:
+        return pd.DataFrame(index=enrich_series_input.index, columns=[enrich_field_name for enrich_field_name, _ in enrich_fields_mapping], dtype=object)
+    enrich_fields_count = max(enrich_field_index for _, enrich_field_index in enrich_fields_mapping) + 1
+    if enrich_series_input.dtype == object:
+        enrich_series_input = enrich_series_input.astype("string[pyarrow]")
+    enrich_names_codes, enrich_names_uniques = pd.factorize(enrich_series_input)
+    if len(enrich_names_uniques) < 0.5 * len(enrich_series_input):
+        enrich_df_uniques = (
+            pd.Series(enrich_names_uniques, dtype="string[pyarrow]")
+            .str.split("_", n=enrich_fields_count, expand=True)
+            .reindex(index=range(len(enrich_names_uniques) + 1), columns=range(enrich_fields_count))
+        )
+        enrich_df_splitted = enrich_df_uniques.take(enrich_names_codes).set_axis(enrich_series_input.index)
+    else:
+        enrich_df_splitted = (
+            enrich_series_input
+            .str.split("_", n=enrich_fields_count, expand=True)
+            .reindex(columns=range(enrich_fields_count))
+        )
+    enrich_names_invalid = int(enrich_df_splitted[enrich_fields_count - 1].isna().sum())
+    if enrich_names_invalid:
+        print(f"⚠️ [ENRICH] Found {enrich_names_invalid} TikTok Ads {enrich_series_input.name} value(s) not following naming convention then missing field(s) are filled with {ENRICH_VALUE_UNKNOWN}.")
+        logging.warning(f"⚠️ [ENRICH] Found {enrich_names_invalid} TikTok Ads {enrich_series_input.name} value(s) not following naming convention then missing field(s) are filled with {ENRICH_VALUE_UNKNOWN}.")
+    return (
+        enrich_df_splitted[[enrich_field_index for _, enrich_field_index in enrich_fields_mapping]]
+        .set_axis([enrich_field_name for enrich_field_name, _ in enrich_fields_mapping], axis=1)
+        .fillna(ENRICH_VALUE_UNKNOWN)
+    )
+
+# 2.2. Derive TikTok Ads date fields from a single datetime parse
+def enrich_date_fields(enrich_series_input: pd.Series) -> dict:
+    if enrich_series_input.isna().all():
+        return {
+            "date": pd.Series(pd.NaT, index=enrich_series_input.index, dtype="datetime64[ns, UTC]"),
+            "year": pd.Series(None, index=enrich_series_input.index, dtype=object),
+            "month": pd.Series(None, index=enrich_series_input.index, dtype=object),
+        }
+    enrich_date_parsed = pd.to_datetime(enrich_series_input, errors="coerce", utc=True)
+    enrich_date_valid = enrich_date_parsed.notna()
+    enrich_date_values = enrich_date_parsed.dt.tz_localize(None).to_numpy()
+    return {
+        "date": enrich_date_parsed.dt.floor("D"),
+        "year": pd.Series(enrich_date_values.astype("datetime64[Y]").astype(str), index=enrich_series_input.index).where(enrich_date_valid),
+        "month": pd.Series(enrich_date_values.astype("datetime64[M]").astype(str), index=enrich_series_input.index).where(enrich_date_valid),
+    }
+
+# 2.3. Broadcast TikTok Ads table-level value as a single-category column
+def enrich_table_field(enrich_value_input: str | None, enrich_rows_count: int) -> pd.Categorical | None:
+    if enrich_value_input is None:
+        return None
+    return pd.Categorical.from_codes(np.zeros(enrich_rows_count, dtype=np.int8), categories=[enrich_value_input])
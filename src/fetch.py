@@ -27,14 +27,28 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 
+# Add Python concurrent execution ultilities for integration
+from concurrent.futures import ThreadPoolExecutor
+
 # Add Python datetime utilities for integration
 from datetime import datetime
 
 # Add Python logging ultilties for integration
 import logging
 
+# Add Python operator ultilities for integration
+from operator import itemgetter
+
 # Add Python requests ultilities for integration
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Add Python random ultilities for integration
+import random
+
+# Add Python threading ultilities for integration
+import threading
 
 # Add Python time ultilities for integration
 import time
@@ -42,6 +56,9 @@ import time
 # Add Python IANA time zone ultilities for integration
 from zoneinfo import ZoneInfo
 
+# Add Python orjson libraries for integration
+import orjson
+
 # Add Python Pandas libraries for integration
 import pandas as pd
 
@@ -72,10 +89,97 @@ LAYER = os.getenv("LAYER")
 # Get environment variable for Mode
 MODE = os.getenv("MODE")
 
+# Define cache lifetime in seconds for Google Secret Manager payloads
+FETCH_SECRET_TTL = 300
+
+# Initialize shared Google Secret Manager client and secret cache across fetch calls
+FETCH_SECRET_CLIENT = None
+FETCH_SECRET_CACHE = {}
+FETCH_SECRET_LOCK = threading.Lock()
+
+# Define cache lifetime in seconds and in-process cache for TikTok Ads advertiser_name
+FETCH_ADVERTISER_TTL = 3600
+FETCH_ADVERTISER_CACHE = {}
+
+# Define maximum concurrent TikTok Ads API calls for metadata fetching
+FETCH_METADATA_WORKERS = 16
+
+# Define maximum concurrent TikTok Ads API calls for insights page fetching
+FETCH_INSIGHTS_WORKERS = 8
+
+# Define TikTok Ads report endpoint for insights fetching
+FETCH_INSIGHTS_URL = "https://business-api.tiktok.com/open_api/v1.3/report/integrated/get/"
+
+# Define fixed TikTok Ads report metrics and dimensions for insights fetching
+FETCH_INSIGHTS_METRICS = (
+    "result",
+    "spend",
+    "impressions",
+    "clicks",
+    "engaged_view_15s",
+    "purchase",
+    "complete_payment",
+    "onsite_total_purchase",
+    "offline_shopping_events",
+    "onsite_shopping",
+    "messaging_total_conversation_tiktok_direct_message"
+)
+FETCH_CAMPAIGN_DIMENSIONS = ("campaign_id", "stat_time_day")
+FETCH_AD_DIMENSIONS = ("ad_id", "stat_time_day")
+
+# Define shared TikTok Ads report parameters for insights fetching
+FETCH_INSIGHTS_PARAMS = {
+    "report_type": "BASIC",
+    "metrics": FETCH_INSIGHTS_METRICS,
+    "page_size": 1000
+}
+
+# Define maximum campaign_id(s) or ad_id(s) filtered per TikTok Ads metadata request
+FETCH_METADATA_BATCH = 100
+
+# Define retry attempts and TikTok Ads API rate limit codes for backoff
+FETCH_RETRY_ATTEMPTS = 5
+FETCH_RETRY_CODES = (40100, 40016)
+
+# Define maximum single backoff and total backoff budget in seconds for TikTok Ads API rate limit codes
+FETCH_RETRY_DELAY_MAX = 8
+FETCH_RETRY_BUDGET = 30
+
+# Define transport retry attempts for HTTP 429/5xx and connection errors on TikTok Ads API calls
+FETCH_HTTP_RETRIES = 3
+
+# Define TikTok Ads video fields and C-level getter for ad creative records
+FETCH_VIDEO_FIELDS = ("video_id", "video_cover_url", "preview_url", "create_time")
+FETCH_VIDEO_GETTER = itemgetter(*FETCH_VIDEO_FIELDS)
+
+# Define client-side token bucket rate in requests per second for TikTok Ads API calls
+FETCH_RATE_PER_SECOND = 10
+
+# Initialize shared token bucket state across TikTok Ads API calls
+FETCH_RATE_BUCKET = {"tokens": float(FETCH_RATE_PER_SECOND), "updated": time.monotonic()}
+FETCH_RATE_LOCK = threading.Lock()
+
+# Define connect and read timeouts in seconds for TikTok Ads API calls
+FETCH_HTTP_TIMEOUT = (5, 60)
+
+# Initialize shared HTTP session with connection pooling and transport retries for TikTok Ads API calls
+FETCH_HTTP_SESSION = requests.Session()
+FETCH_HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=FETCH_METADATA_WORKERS,
+    max_retries=Retry(
+        total=FETCH_HTTP_RETRIES,
+        backoff_factor=0.5,
+        backoff_max=FETCH_RETRY_DELAY_MAX,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+))
+
 # 1. FETCH TIKTOK ADS METADATA
 
 # 1.1. Fetch campaign metadata for TikTok Ads
-def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
+def fetch_campaign_metadata(fetch_campaign_ids: list[str], fetch_enforce_schema: bool = True) -> pd.DataFrame:
     print(f"🚀 [FETCH] Starting to fetch TikTok Ads campaign metadata for {len(fetch_campaign_ids)} campaign_id(s)...")
     logging.info(f"🚀 [FETCH] Starting to fetch TikTok Ads campaign metadata for {len(fetch_campaign_ids)} campaign_id(s)...")
 
@@ -86,87 +190,56 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
     fetch_sections_time = {}
     print(f"🔍 [FETCH] Proceeding to fetch TikTok Ads campaign metadata at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
     logging.info(f"🔍 [FETCH] Proceeding to fetch TikTok Ads campaign metadata at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
+    fetch_campaign_unique = list(dict.fromkeys(fetch_campaign_ids))
+    if len(fetch_campaign_unique) < len(fetch_campaign_ids):
+        print(f"⚠️ [FETCH] Skipped {len(fetch_campaign_ids) - len(fetch_campaign_unique)} duplicated campaign_id(s) before fetching TikTok Ads campaign metadata.")
+        logging.warning(f"⚠️ [FETCH] Skipped {len(fetch_campaign_ids) - len(fetch_campaign_unique)} duplicated campaign_id(s) before fetching TikTok Ads campaign metadata.")
+    fetch_campaign_ids = fetch_campaign_unique
 
     try:
     
-    # 1.1.2 Initialize Google Secret Manager client
-        fetch_section_name = "[FETCH] Initialize Google Secret Manager client"
-        fetch_section_start = time.time()                
-        try:
-            print(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            logging.info(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            google_secret_client = secretmanager.SecretManagerServiceClient()
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-            logging.info(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")          
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2) 
-
-    # 1.1.3. Get TikTok Ads access token from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads access token from Google Secret Manager"
-        fetch_section_start = time.time()              
-        try: 
-            print(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
-            token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
-            token_secret_response = google_secret_client.access_secret_version(request={"name": token_secret_name})
-            fetch_access_user = token_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-    
-    # 1.1.4. Get TikTok Ads advertiser_id from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads advertiser_id from Google Secret Manager"
-        fetch_section_start = time.time()        
+    # 1.1.2. Get TikTok Ads credentials from Google Secret Manager
+        fetch_section_name = "[FETCH] Get TikTok Ads credentials from Google Secret Manager"
+        fetch_section_start = time.time()
         try:
-            print(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
-            advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
-            advertiser_secret_response = google_secret_client.access_secret_version(request={"name": advertiser_secret_name})
-            fetch_advertiser_id = advertiser_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")           
+            if not fetch_campaign_ids:
+                fetch_access_user = None
+                fetch_advertiser_id = None
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped retrieving TikTok Ads credentials for account {ACCOUNT} as no campaign_id(s) were given.")
+                logging.info(f"⏭️ [FETCH] Skipped retrieving TikTok Ads credentials for account {ACCOUNT} as no campaign_id(s) were given.")
+            else:
+                print(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+                logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+                fetch_credentials = fetch_secret_credentials()
+                fetch_access_user = fetch_credentials["fetch_access_user"]
+                fetch_advertiser_id = fetch_credentials["fetch_advertiser_id"]
+                fetch_sections_status[fetch_section_name] = "succeed"
+                print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
+                logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
+            print(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
+            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.1.5. Make TikTok Ads API call for advertiser endpoint
+    # 1.1.3. Make TikTok Ads API call for advertiser endpoint
         fetch_section_name = "[FETCH] Make TikTok Ads API call for advertiser endpoint"
         fetch_section_start = time.time()     
-        try: 
-            print(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
-            logging.info(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
-            fetch_advertiser_url = "https://business-api.tiktok.com/open_api/v1.3/advertiser/info/"
-            fetch_advertiser_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
-            }            
-            fetch_advertiser_payload = {"advertiser_ids": [fetch_advertiser_id]}
-            fetch_advertiser_response = requests.get(
-                fetch_advertiser_url, 
-                headers=fetch_advertiser_headers, 
-                json=fetch_advertiser_payload
-            )
-            fetch_advertiser_name = fetch_advertiser_response.json()["data"]["list"][0]["name"]       
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")
-            logging.info(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")           
+        try:
+            if not fetch_campaign_ids:
+                fetch_advertiser_name = None
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped retrieving TikTok Ads advertiser_name as no campaign_id(s) were given.")
+                logging.info(f"⏭️ [FETCH] Skipped retrieving TikTok Ads advertiser_name as no campaign_id(s) were given.")
+            else:
+                print(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
+                logging.info(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
+                fetch_advertiser_name = fetch_advertiser_info(fetch_access_user, fetch_advertiser_id)
+                fetch_sections_status[fetch_section_name] = "succeed"
+                print(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")
+                logging.info(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")           
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
             print(f"❌ [FETCH] Failed to fetch advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id} due to {e}.")
@@ -174,7 +247,7 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.1.6. Make TikTok Ads API call for campaign endpoint
+    # 1.1.4. Make TikTok Ads API call for campaign endpoint
         fetch_section_name = "[FETCH] Make TikTok Ads API call for campaign metadata"
         fetch_section_start = time.time()           
         try:
@@ -183,8 +256,7 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
             fetch_campaign_metadatas = []
             fetch_campaign_url = "https://business-api.tiktok.com/open_api/v1.3/campaign/get/"
             fetch_campaign_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
+                "Access-Token": fetch_access_user
             }
             fetch_campaign_fields = [
                 "advertiser_id",
@@ -194,27 +266,20 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
                 "objective_type",
                 "create_time"
             ]
-            for fetch_campaign_id in fetch_campaign_ids:
-                try:
-                    fetch_campaign_payload = {
-                        "advertiser_id": fetch_advertiser_id,
-                        "filtering": {"campaign_ids": [fetch_campaign_id]},
-                        "fields": fetch_campaign_fields
-                    }
-                    fetch_campaign_response = requests.get(
-                        fetch_campaign_url, 
-                        headers=fetch_campaign_headers, 
-                        json=fetch_campaign_payload
-                    )
-                    fetch_campaign_response.raise_for_status()
-                    fetch_campaign_json = fetch_campaign_response.json()
-                    fetch_campaign_metadata = fetch_campaign_json["data"]["list"][0]
-                    fetch_campaign_metadata["advertiser_name"] = fetch_advertiser_name
-                    fetch_campaign_metadatas.append(fetch_campaign_metadata)
-                except Exception as e:
-                    print(f"⚠️ [FETCH] Failed to retrieve TikTok Ads campaign metadata for campaign_id {fetch_campaign_id} due to {e}.")
-                    logging.warning(f"⚠️ [FETCH] Failed to retrieve TikTok Ads campaign metadata for campaign_id {fetch_campaign_id} due to {e}.")
-            fetch_df_flattened = pd.DataFrame(fetch_campaign_metadatas)
+            fetch_campaign_chunks = [
+                fetch_campaign_ids[fetch_chunk_start:fetch_chunk_start + FETCH_METADATA_BATCH]
+                for fetch_chunk_start in range(0, len(fetch_campaign_ids), FETCH_METADATA_BATCH)
+            ]
+            with ThreadPoolExecutor(max_workers=FETCH_METADATA_WORKERS) as fetch_campaign_executor:
+                fetch_campaign_results = fetch_campaign_executor.map(
+                    lambda fetch_campaign_chunk_ids: fetch_metadata_chunk(fetch_campaign_url, fetch_campaign_headers, fetch_advertiser_id, "campaign_ids", fetch_campaign_chunk_ids, fetch_campaign_fields),
+                    fetch_campaign_chunks
+                )
+                for fetch_campaign_chunk_records in fetch_campaign_results:
+                    for fetch_campaign_metadata in fetch_campaign_chunk_records:
+                        fetch_campaign_metadata["advertiser_name"] = fetch_advertiser_name
+                        fetch_campaign_metadatas.append(fetch_campaign_metadata)
+            fetch_df_flattened = pd.DataFrame.from_records(fetch_campaign_metadatas, columns=fetch_campaign_fields + ["advertiser_name"])
             if len(fetch_campaign_metadatas) == len(fetch_campaign_ids):
                 fetch_sections_status[fetch_section_name] = "succeed"
                 print(f"✅ [FETCH] Successfully retrieved TikTok Ads campaign metadata with {len(fetch_campaign_metadatas)}/{len(fetch_campaign_ids)} campaign_id(s) for advertiser_id {fetch_advertiser_id}.")
@@ -230,32 +295,43 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.1.7. Trigger to enforce schema for TikTok Ads campaign metadata
+    # 1.1.5. Trigger to enforce schema for TikTok Ads campaign metadata
         fetch_section_name = "[FETCH] Trigger to enforce schema for TikTok Ads campaign metadata"
         fetch_section_start = time.time()
         try:
-            print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads campaign metadata with {len(fetch_df_flattened)} retrieved row(s)...")
-            logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads campaign metadata with {len(fetch_df_flattened)} retrieved row(s)...")
-            fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_campaign_metadata")            
-            fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
-            fetch_status_enforced = fetch_results_schema["schema_status_final"]
-            fetch_df_enforced = fetch_results_schema["schema_df_final"]    
-            if fetch_status_enforced == "schema_succeed_all":
+            if not fetch_enforce_schema:
+                fetch_df_enforced = fetch_df_flattened
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped TikTok Ads campaign metadata schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+                logging.info(f"⏭️ [FETCH] Skipped TikTok Ads campaign metadata schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+            elif fetch_df_flattened.empty:
+                fetch_df_enforced = fetch_df_flattened
                 fetch_sections_status[fetch_section_name] = "succeed"
-                print(f"✅ [FETCH] Successfully triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-            elif fetch_status_enforced == "schema_succeed_partial":
-                fetch_sections_status[fetch_section_name] = "partial"
-                print(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"⚠️ [FETCH] Skipped TikTok Ads campaign metadata schema enforcement as no rows were retrieved.")
+                logging.warning(f"⚠️ [FETCH] Skipped TikTok Ads campaign metadata schema enforcement as no rows were retrieved.")
             else:
-                fetch_sections_status[fetch_section_name] = "failed"
-                print(f"❌ [FETCH] Failed to trigger TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads campaign metadata with {len(fetch_df_flattened)} retrieved row(s)...")
+                logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads campaign metadata with {len(fetch_df_flattened)} retrieved row(s)...")
+                fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_campaign_metadata")            
+                fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
+                fetch_status_enforced = fetch_results_schema["schema_status_final"]
+                fetch_df_enforced = fetch_results_schema["schema_df_final"]    
+                if fetch_status_enforced == "schema_succeed_all":
+                    fetch_sections_status[fetch_section_name] = "succeed"
+                    print(f"✅ [FETCH] Successfully triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                elif fetch_status_enforced == "schema_succeed_partial":
+                    fetch_sections_status[fetch_section_name] = "partial"
+                    print(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                else:
+                    fetch_sections_status[fetch_section_name] = "failed"
+                    print(f"❌ [FETCH] Failed to trigger TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads campaign metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.1.8. Summarize fetch results for TikTok Ads campaign metadata
+    # 1.1.6. Summarize fetch results for TikTok Ads campaign metadata
     finally:
         fetch_time_elapsed = round(time.time() - fetch_time_start, 2)
         fetch_df_final = fetch_df_enforced.copy() if "fetch_df_enforced" in locals() and not fetch_df_enforced.empty else pd.DataFrame()
@@ -303,7 +379,7 @@ def fetch_campaign_metadata(fetch_campaign_ids: list[str]) -> pd.DataFrame:
     return fetch_results_final
 
 # 1.2. Fetch ad metadata for TikTok Ads
-def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
+def fetch_ad_metadata(fetch_ad_ids: list[str], fetch_enforce_schema: bool = True) -> pd.DataFrame:
     print(f"🚀 [FETCH] Starting to fetch TikTok Ads ad metadata for {len(fetch_ad_ids)} ad_id(s)...")
     logging.info(f"🚀 [FETCH] Starting to fetch TikTok Ads ad metadata for {len(fetch_ad_ids)} ad_id(s)...")
 
@@ -314,87 +390,56 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
     fetch_sections_time = {}
     print(f"🔍 [FETCH] Proceeding to fetch TikTok Ads ad metadata at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
     logging.info(f"🔍 [FETCH] Proceeding to fetch TikTok Ads ad metadata at {datetime.now(ICT).strftime("%Y-%m-%d %H:%M:%S")}...")
+    fetch_ad_unique = list(dict.fromkeys(fetch_ad_ids))
+    if len(fetch_ad_unique) < len(fetch_ad_ids):
+        print(f"⚠️ [FETCH] Skipped {len(fetch_ad_ids) - len(fetch_ad_unique)} duplicated ad_id(s) before fetching TikTok Ads ad metadata.")
+        logging.warning(f"⚠️ [FETCH] Skipped {len(fetch_ad_ids) - len(fetch_ad_unique)} duplicated ad_id(s) before fetching TikTok Ads ad metadata.")
+    fetch_ad_ids = fetch_ad_unique
 
     try:
 
-    # 1.2.2 Initialize Google Secret Manager client
-        fetch_section_name = "[FETCH] Initialize Google Secret Manager client"
-        fetch_section_start = time.time()          
+    # 1.2.2. Get TikTok Ads credentials from Google Secret Manager
+        fetch_section_name = "[FETCH] Get TikTok Ads credentials from Google Secret Manager"
+        fetch_section_start = time.time()
         try:
-            print(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            logging.info(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            google_secret_client = secretmanager.SecretManagerServiceClient()
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-            logging.info(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2) 
-
-    # 1.2.3. Get TikTok Ads access token from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads access token from Google Secret Manager"
-        fetch_section_start = time.time()              
-        try: 
-            print(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
-            token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
-            token_secret_response = google_secret_client.access_secret_version(request={"name": token_secret_name})
-            fetch_access_user = token_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")           
+            if not fetch_ad_ids:
+                fetch_access_user = None
+                fetch_advertiser_id = None
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped retrieving TikTok Ads credentials for account {ACCOUNT} as no ad_id(s) were given.")
+                logging.info(f"⏭️ [FETCH] Skipped retrieving TikTok Ads credentials for account {ACCOUNT} as no ad_id(s) were given.")
+            else:
+                print(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+                logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+                fetch_credentials = fetch_secret_credentials()
+                fetch_access_user = fetch_credentials["fetch_access_user"]
+                fetch_advertiser_id = fetch_credentials["fetch_advertiser_id"]
+                fetch_sections_status[fetch_section_name] = "succeed"
+                print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
+                logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
+            print(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
+            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.2.4. Get TikTok Ads advertiser_id from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads advertiser_id from Google Secret Manager"
-        fetch_section_start = time.time()        
-        try:
-            print(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
-            advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
-            advertiser_secret_response = google_secret_client.access_secret_version(request={"name": advertiser_secret_name})
-            fetch_advertiser_id = advertiser_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")           
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-    
-    # 1.2.5. Make TikTok Ads API call for advertiser endpoint
+    # 1.2.3. Make TikTok Ads API call for advertiser endpoint
         fetch_section_name = "[FETCH] Make TikTok Ads API call for advertiser endpoint"
         fetch_section_start = time.time()     
-        try: 
-            print(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
-            logging.info(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
-            fetch_advertiser_url = "https://business-api.tiktok.com/open_api/v1.3/advertiser/info/"
-            fetch_advertiser_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
-            }            
-            fetch_advertiser_payload = {"advertiser_ids": [fetch_advertiser_id]}
-            fetch_advertiser_response = requests.get(
-                fetch_advertiser_url, 
-                headers=fetch_advertiser_headers, 
-                json=fetch_advertiser_payload
-            )
-            fetch_advertiser_name = fetch_advertiser_response.json()["data"]["list"][0]["name"]       
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")
-            logging.info(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")           
+        try:
+            if not fetch_ad_ids:
+                fetch_advertiser_name = None
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped retrieving TikTok Ads advertiser_name as no ad_id(s) were given.")
+                logging.info(f"⏭️ [FETCH] Skipped retrieving TikTok Ads advertiser_name as no ad_id(s) were given.")
+            else:
+                print(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
+                logging.info(f"🔍 [FETCH] Retrieving advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id}...")
+                fetch_advertiser_name = fetch_advertiser_info(fetch_access_user, fetch_advertiser_id)
+                fetch_sections_status[fetch_section_name] = "succeed"
+                print(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")
+                logging.info(f"✅ [FETCH] Successfully retrieved advertiser_name {fetch_advertiser_name} for TikTok Ads advertiser_id {fetch_advertiser_id}.")           
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
             print(f"❌ [FETCH] Failed to fetch advertiser_name for TikTok Ads advertiser_id {fetch_advertiser_id} due to {e}.")
@@ -402,7 +447,7 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.2.6. Make TikTok Ads API call for ad endpoint
+    # 1.2.4. Make TikTok Ads API call for ad endpoint
         fetch_section_name = "[FETCH] Make TikTok Ads API call for ad endpoint"
         fetch_section_start = time.time()            
         try:
@@ -411,8 +456,7 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
             fetch_ad_metadatas = []
             fetch_ad_url = "https://business-api.tiktok.com/open_api/v1.3/ad/get/"
             fetch_ad_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
+                "Access-Token": fetch_access_user
             }
             fetch_ad_fields = [
                 "advertiser_id",
@@ -428,27 +472,20 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
                 "optimization_event",
                 "video_id"
             ]
-            for fetch_ad_id in fetch_ad_ids:
-                try:
-                    fetch_ad_payload = {
-                        "advertiser_id": fetch_advertiser_id,
-                        "filtering": {"ad_ids": [fetch_ad_id]},
-                        "fields": fetch_ad_fields
-                    }
-                    fetch_ad_response = requests.get(
-                        fetch_ad_url, 
-                        headers=fetch_ad_headers, 
-                        json=fetch_ad_payload
-                    )
-                    fetch_ad_response.raise_for_status()
-                    fetch_ad_json = fetch_ad_response.json()
-                    fetch_ad_metadata = fetch_ad_json["data"]["list"][0]
-                    fetch_ad_metadata["advertiser_name"] = fetch_advertiser_name
-                    fetch_ad_metadatas.append(fetch_ad_metadata)                    
-                except Exception as e:
-                    print(f"⚠️ [FETCH] Failed to retrieve TikTok Ads ad metadata for ad_id {fetch_ad_id} due to {e}.")
-                    logging.warning(f"⚠️ [FETCH] Failed to retrieve TikTok Ads ad metadata for ad_id {fetch_ad_id} due to {e}.")
-            fetch_df_flattened = pd.DataFrame(fetch_ad_metadatas)
+            fetch_ad_chunks = [
+                fetch_ad_ids[fetch_chunk_start:fetch_chunk_start + FETCH_METADATA_BATCH]
+                for fetch_chunk_start in range(0, len(fetch_ad_ids), FETCH_METADATA_BATCH)
+            ]
+            with ThreadPoolExecutor(max_workers=FETCH_METADATA_WORKERS) as fetch_ad_executor:
+                fetch_ad_results = fetch_ad_executor.map(
+                    lambda fetch_ad_chunk_ids: fetch_metadata_chunk(fetch_ad_url, fetch_ad_headers, fetch_advertiser_id, "ad_ids", fetch_ad_chunk_ids, fetch_ad_fields),
+                    fetch_ad_chunks
+                )
+                for fetch_ad_chunk_records in fetch_ad_results:
+                    for fetch_ad_metadata in fetch_ad_chunk_records:
+                        fetch_ad_metadata["advertiser_name"] = fetch_advertiser_name
+                        fetch_ad_metadatas.append(fetch_ad_metadata)
+            fetch_df_flattened = pd.DataFrame.from_records(fetch_ad_metadatas, columns=fetch_ad_fields + ["advertiser_name"])
             if len(fetch_ad_metadatas) == len(fetch_ad_ids):
                 fetch_sections_status[fetch_section_name] = "succeed"
                 print(f"✅ [FETCH] Successfully retrieved TikTok Ads ad metadata with {len(fetch_ad_metadatas)}/{len(fetch_ad_ids)} ad_id(s) for advertiser_id {fetch_advertiser_id}.")
@@ -464,32 +501,43 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.2.7. Trigger to enforce schema for TikTok Ads ad metadata
+    # 1.2.5. Trigger to enforce schema for TikTok Ads ad metadata
         fetch_section_name = "[FETCH] Trigger to enforce schema for TikTok Ads ad metadata"
         fetch_section_start = time.time()
         try:
-            print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad metadata with {len(fetch_df_flattened)} retrieved row(s)...")
-            logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad metadata with {len(fetch_df_flattened)} retrieved row(s)...")
-            fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_metadata")            
-            fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
-            fetch_status_enforced = fetch_results_schema["schema_status_final"]
-            fetch_df_enforced = fetch_results_schema["schema_df_final"]    
-            if fetch_status_enforced == "schema_succeed_all":
+            if not fetch_enforce_schema:
+                fetch_df_enforced = fetch_df_flattened
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped TikTok Ads ad metadata schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+                logging.info(f"⏭️ [FETCH] Skipped TikTok Ads ad metadata schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+            elif fetch_df_flattened.empty:
+                fetch_df_enforced = fetch_df_flattened
                 fetch_sections_status[fetch_section_name] = "succeed"
-                print(f"✅ [FETCH] Successfully triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-            elif fetch_status_enforced == "schema_succeed_partial":
-                fetch_sections_status[fetch_section_name] = "partial"
-                print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"⚠️ [FETCH] Skipped TikTok Ads ad metadata schema enforcement as no rows were retrieved.")
+                logging.warning(f"⚠️ [FETCH] Skipped TikTok Ads ad metadata schema enforcement as no rows were retrieved.")
             else:
-                fetch_sections_status[fetch_section_name] = "failed"
-                print(f"❌ [FETCH] Failed to trigger TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad metadata with {len(fetch_df_flattened)} retrieved row(s)...")
+                logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad metadata with {len(fetch_df_flattened)} retrieved row(s)...")
+                fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_metadata")            
+                fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
+                fetch_status_enforced = fetch_results_schema["schema_status_final"]
+                fetch_df_enforced = fetch_results_schema["schema_df_final"]    
+                if fetch_status_enforced == "schema_succeed_all":
+                    fetch_sections_status[fetch_section_name] = "succeed"
+                    print(f"✅ [FETCH] Successfully triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                elif fetch_status_enforced == "schema_succeed_partial":
+                    fetch_sections_status[fetch_section_name] = "partial"
+                    print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                else:
+                    fetch_sections_status[fetch_section_name] = "failed"
+                    print(f"❌ [FETCH] Failed to trigger TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad metadata schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.2.8. Summarize fetch results for TikTok Ads ad metadata
+    # 1.2.6. Summarize fetch results for TikTok Ads ad metadata
     finally:
         fetch_time_elapsed = round(time.time() - fetch_time_start, 2)
         fetch_df_final = fetch_df_enforced.copy() if "fetch_df_enforced" in locals() and not fetch_df_enforced.empty else pd.DataFrame()
@@ -537,7 +585,7 @@ def fetch_ad_metadata(fetch_ad_ids: list[str]) -> pd.DataFrame:
     return fetch_results_final
 
 # 1.3. Fetch ad creative for TikTok Ads
-def fetch_ad_creative() -> pd.DataFrame:
+def fetch_ad_creative(fetch_enforce_schema: bool = True) -> pd.DataFrame:
     print("🚀 [FETCH] Starting to fetch TikTok Ads ad creative...")
     logging.info("🚀 [FETCH] Starting to fetch TikTok Ads ad creative...")
 
@@ -551,64 +599,26 @@ def fetch_ad_creative() -> pd.DataFrame:
 
     try:
 
-    # 1.3.2 Initialize Google Secret Manager client
-        fetch_section_name = "[FETCH] Initialize Google Secret Manager client"
-        fetch_section_start = time.time()                
-        try:
-            print(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            logging.info(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            google_secret_client = secretmanager.SecretManagerServiceClient()
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-            logging.info(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")            
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 1.3.3. Get TikTok Ads access token from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads access token from Google Secret Manager"
-        fetch_section_start = time.time()              
-        try: 
-            print(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")            
-            token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
-            token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
-            token_secret_response = google_secret_client.access_secret_version(request={"name": token_secret_name})
-            fetch_access_user = token_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 1.3.4. Get TikTok Ads advertiser_id from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads advertiser_id from Google Secret Manager"
-        fetch_section_start = time.time()        
+    # 1.3.2. Get TikTok Ads credentials from Google Secret Manager
+        fetch_section_name = "[FETCH] Get TikTok Ads credentials from Google Secret Manager"
+        fetch_section_start = time.time()
         try:
-            print(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
-            advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
-            advertiser_secret_response = google_secret_client.access_secret_version(request={"name": advertiser_secret_name})
-            fetch_advertiser_id = advertiser_secret_response.payload.data.decode("utf-8")
+            print(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            fetch_credentials = fetch_secret_credentials()
+            fetch_access_user = fetch_credentials["fetch_access_user"]
+            fetch_advertiser_id = fetch_credentials["fetch_advertiser_id"]
             fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
+            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
+            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
+            print(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
+            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.3.5. Make TikTok Ads API call for file/video/ad/search endpoint
+    # 1.3.3. Make TikTok Ads API call for file/video/ad/search endpoint
         fetch_section_name = "[FETCH] Make TikTok Ads API call for file/video/ad/search endpoint"
         fetch_section_start = time.time()           
         try:
@@ -617,40 +627,41 @@ def fetch_ad_creative() -> pd.DataFrame:
             fetch_ad_creatives = []
             fetch_video_url = "https://business-api.tiktok.com/open_api/v1.3/file/video/ad/search/"
             fetch_video_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
+                "Access-Token": fetch_access_user
             }
-            fetch_pagination_current = 1
-            fetch_pagination_continue = True
-            while fetch_pagination_continue:
-                fetch_video_payload = {
-                    "advertiser_id": fetch_advertiser_id,
-                    "page_size": 100,
-                    "page": fetch_pagination_current
-                }
-                fetch_video_response = requests.get(
-                    fetch_video_url, 
-                    headers=fetch_video_headers, 
-                    json=fetch_video_payload
-                )
-                fetch_video_response.raise_for_status()
-                fetch_video_json = fetch_video_response.json()
-                if fetch_video_json.get("code") == 0 and fetch_video_json.get("data", {}).get("list"):
-                    for fetch_video_record in fetch_video_json["data"]["list"]:
-                        fetch_ad_creatives.append({
-                            "advertiser_id": fetch_advertiser_id,
-                            "video_id": fetch_video_record.get("video_id"),
-                            "video_cover_url": fetch_video_record.get("video_cover_url"),
-                            "preview_url": fetch_video_record.get("preview_url"),
-                            "create_time": fetch_video_record.get("create_time")
-                        })
-                    page_info = fetch_video_json["data"].get("page_info", {})
-                    total_page = page_info.get("total_page", 1)
-                    fetch_pagination_continue = fetch_pagination_current < total_page
-                    fetch_pagination_current += 1
-                else:
-                    fetch_pagination_continue = False
-            fetch_df_flattened = pd.DataFrame(fetch_ad_creatives)
+            fetch_video_payload = {
+                "advertiser_id": fetch_advertiser_id,
+                "page_size": 100,
+                "page": 1
+            }
+            fetch_video_pages = [fetch_api_request(fetch_video_url, fetch_video_headers, fetch_video_payload)]
+            if fetch_video_pages[0].get("code") == 0 and fetch_video_pages[0].get("data", {}).get("list"):
+                fetch_pagination_total = fetch_video_pages[0]["data"].get("page_info", {}).get("total_page", 1)
+                with ThreadPoolExecutor(max_workers=FETCH_METADATA_WORKERS) as fetch_video_executor:
+                    fetch_video_pages.extend(fetch_video_executor.map(
+                        lambda fetch_pagination_current: fetch_api_request(fetch_video_url, fetch_video_headers, {**fetch_video_payload, "page": fetch_pagination_current}),
+                        range(2, fetch_pagination_total + 1)
+                    ))
+            fetch_video_seen = set()
+            fetch_video_duplicated = 0
+            for fetch_video_json in fetch_video_pages:
+                if not (fetch_video_json.get("code") == 0 and fetch_video_json.get("data", {}).get("list")):
+                    break
+                for fetch_video_record in fetch_video_json["data"]["list"]:
+                    fetch_video_id = fetch_video_record.get("video_id")
+                    if fetch_video_id is not None:
+                        if fetch_video_id in fetch_video_seen:
+                            fetch_video_duplicated += 1
+                            continue
+                        fetch_video_seen.add(fetch_video_id)
+                    try:
+                        fetch_ad_creatives.append((fetch_advertiser_id, *FETCH_VIDEO_GETTER(fetch_video_record)))
+                    except KeyError:
+                        fetch_ad_creatives.append((fetch_advertiser_id, *(fetch_video_record.get(fetch_video_field) for fetch_video_field in FETCH_VIDEO_FIELDS)))
+            fetch_df_flattened = pd.DataFrame.from_records(fetch_ad_creatives, columns=["advertiser_id", *FETCH_VIDEO_FIELDS])
+            if fetch_video_duplicated:
+                print(f"⚠️ [FETCH] Skipped {fetch_video_duplicated} duplicated video_id record(s) across TikTok Ads video pages for advertiser_id {fetch_advertiser_id}.")
+                logging.warning(f"⚠️ [FETCH] Skipped {fetch_video_duplicated} duplicated video_id record(s) across TikTok Ads video pages for advertiser_id {fetch_advertiser_id}.")
             fetch_sections_status[fetch_section_name] = "succeed"
             print(f"✅ [FETCH] Successfully retrieved TikTok Ads ad creative for {len(fetch_df_flattened)} row(s) for TikTok Ads advertiser_id {fetch_advertiser_id}.")
             logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads ad creative for {len(fetch_df_flattened)} row(s) for TikTok Ads advertiser_id {fetch_advertiser_id}.")
@@ -661,32 +672,43 @@ def fetch_ad_creative() -> pd.DataFrame:
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
     
-    # 1.3.6. Trigger to enforce schema for TikTok Ads ad creative
+    # 1.3.4. Trigger to enforce schema for TikTok Ads ad creative
         fetch_section_name = "[FETCH] Trigger to enforce schema for TikTok Ads ad creative"
         fetch_section_start = time.time()
         try:
-            print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad creative with {len(fetch_df_flattened)} retrieved row(s)...")
-            logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad creative with {len(fetch_df_flattened)} retrieved row(s)...")
-            fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_creative")            
-            fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
-            fetch_status_enforced = fetch_results_schema["schema_status_final"]
-            fetch_df_enforced = fetch_results_schema["schema_df_final"]    
-            if fetch_status_enforced == "schema_succeed_all":
+            if not fetch_enforce_schema:
+                fetch_df_enforced = fetch_df_flattened
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped TikTok Ads ad creative schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+                logging.info(f"⏭️ [FETCH] Skipped TikTok Ads ad creative schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+            elif fetch_df_flattened.empty:
+                fetch_df_enforced = fetch_df_flattened
                 fetch_sections_status[fetch_section_name] = "succeed"
-                print(f"✅ [FETCH] Successfully triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-            elif fetch_status_enforced == "schema_succeed_partial":
-                fetch_sections_status[fetch_section_name] = "partial"
-                print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"⚠️ [FETCH] Skipped TikTok Ads ad creative schema enforcement as no rows were retrieved.")
+                logging.warning(f"⚠️ [FETCH] Skipped TikTok Ads ad creative schema enforcement as no rows were retrieved.")
             else:
-                fetch_sections_status[fetch_section_name] = "failed"
-                print(f"❌ [FETCH] Failed to trigger TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad creative with {len(fetch_df_flattened)} retrieved row(s)...")
+                logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad creative with {len(fetch_df_flattened)} retrieved row(s)...")
+                fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_creative")            
+                fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
+                fetch_status_enforced = fetch_results_schema["schema_status_final"]
+                fetch_df_enforced = fetch_results_schema["schema_df_final"]    
+                if fetch_status_enforced == "schema_succeed_all":
+                    fetch_sections_status[fetch_section_name] = "succeed"
+                    print(f"✅ [FETCH] Successfully triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                elif fetch_status_enforced == "schema_succeed_partial":
+                    fetch_sections_status[fetch_section_name] = "partial"
+                    print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                else:
+                    fetch_sections_status[fetch_section_name] = "failed"
+                    print(f"❌ [FETCH] Failed to trigger TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad creative schema enforcement with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 1.3.7. Summarize fetch results for TikTok Ads ad creative
+    # 1.3.5. Summarize fetch results for TikTok Ads ad creative
     finally:
         fetch_time_elapsed = round(time.time() - fetch_time_start, 2)
         fetch_df_final = fetch_df_enforced.copy() if "fetch_df_enforced" in locals() and not fetch_df_enforced.empty else pd.DataFrame()
@@ -730,7 +752,7 @@ def fetch_ad_creative() -> pd.DataFrame:
 # 2. FETCH TIKTOK ADS INSIGHTS
 
 # 2.1. Fetch campaign insights for TikTok Ads
-def fetch_campaign_insights(fetch_date_start: str, fetch_date_end: str) -> pd.DataFrame:
+def fetch_campaign_insights(fetch_date_start: str, fetch_date_end: str, fetch_enforce_schema: bool = True) -> pd.DataFrame:
     print(f"🚀 [FETCH] Starting to fetch TikTok Ads campaign insights from {fetch_date_start} to {fetch_date_end}...")
     logging.info(f"🚀 [FETCH] Starting to fetch TikTok Ads campaign insights from {fetch_date_start} to {fetch_date_end}...")      
 
@@ -744,124 +766,42 @@ def fetch_campaign_insights(fetch_date_start: str, fetch_date_end: str) -> pd.Da
 
     try:
         
-    # 2.1.2. Initialize Google Secret Manager client
-        fetch_section_name = "[FETCH] Initialize Google Secret Manager client"
-        fetch_section_start = time.time()           
+    # 2.1.2. Get TikTok Ads credentials from Google Secret Manager
+        fetch_section_name = "[FETCH] Get TikTok Ads credentials from Google Secret Manager"
+        fetch_section_start = time.time()
         try:
-            print(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            logging.info(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            google_secret_client = secretmanager.SecretManagerServiceClient()
+            print(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            fetch_credentials = fetch_secret_credentials()
+            fetch_access_user = fetch_credentials["fetch_access_user"]
+            fetch_advertiser_id = fetch_credentials["fetch_advertiser_id"]
             fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-            logging.info(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")            
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 2.1.3. Get TikTok Ads access token from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads access token from Google Secret Manager"
-        fetch_section_start = time.time()              
-        try: 
-            print(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
-            token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
-            token_secret_response = google_secret_client.access_secret_version(request={"name": token_secret_name})
-            fetch_access_user = token_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
+            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
+            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
+            print(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
+            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 2.1.4. Get TikTok Ads advertiser_id from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads advertiser_id from Google Secret Manager"
-        fetch_section_start = time.time()        
-        try:
-            print(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
-            advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
-            advertiser_secret_response = google_secret_client.access_secret_version(request={"name": advertiser_secret_name})
-            fetch_advertiser_id = advertiser_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")           
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 2.1.5. Make TikTok Ads API call for campaign insights
+    # 2.1.3. Make TikTok Ads API call for campaign insights
         fetch_section_name = "[FETCH] Make TikTok Ads API call for campaign insights"
         fetch_section_start = time.time()
         try:
             print(f"🔍 [FETCH] Retrieving TikTok Ads campaign insights for advertiser_id {fetch_advertiser_id} from {fetch_date_start} to {fetch_date_end}...")
             logging.info(f"🔍 [FETCH] Retrieving TikTok Ads campaign insights for advertiser_id {fetch_advertiser_id} from {fetch_date_start} to {fetch_date_end}...")
             fetch_attempts_queued = 2
-            fetch_campaign_insights = []
-            fetch_campaign_records = []         
-            fetch_campaign_url = "https://business-api.tiktok.com/open_api/v1.3/report/integrated/get/"
-            fetch_campaign_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
-            } 
-            fetch_campaign_params = {
-                "advertiser_id": fetch_advertiser_id,
-                "report_type": "BASIC",
-                "data_level": "AUCTION_CAMPAIGN",
-                "dimensions": ["campaign_id", "stat_time_day"],
-                "metrics": [
-                    "result",
-                    "spend",
-                    "impressions",
-                    "clicks",
-                    "engaged_view_15s",
-                    "purchase",
-                    "complete_payment",
-                    "onsite_total_purchase",
-                    "offline_shopping_events",
-                    "onsite_shopping",
-                    "messaging_total_conversation_tiktok_direct_message"
-                ],
-                "start_date": fetch_date_start,
-                "end_date": fetch_date_end,
-                "page_size": 1000,
-                "page": 1
-            }  
             for fetch_attempt_queued in range(fetch_attempts_queued):
                 try:
-                    while True:
-                        fetch_campaign_response = requests.get(
-                            fetch_campaign_url,
-                            headers=fetch_campaign_headers,
-                            json=fetch_campaign_params,
-                            timeout=60
-                        )
-                        fetch_campaign_json = fetch_campaign_response.json()
-                        if fetch_campaign_json.get("code") != 0:
-                            raise Exception(f"❌ [FETCH] Failed to retrieve TikTok Ads campaign insights due to API error {fetch_campaign_json.get('message')}.")
-                        fetch_campaign_batch = fetch_campaign_json["data"].get("list", [])
-                        fetch_campaign_records.extend(fetch_campaign_batch)
-                        if len(fetch_campaign_batch) < fetch_campaign_params["page_size"]:
-                            break
-                        fetch_campaign_params["page"] += 1                  
-                    for fetch_record_campaign in fetch_campaign_records:
-                        fetch_campaign_insight = {}
-                        fetch_campaign_insight.update(fetch_record_campaign.get("dimensions", {}))
-                        fetch_campaign_insight.update(fetch_record_campaign.get("metrics", {}))
-                        fetch_campaign_insight["advertiser_id"] = fetch_campaign_params["advertiser_id"]
-                        fetch_campaign_insights.append(fetch_campaign_insight)
-                    fetch_df_flattened = pd.DataFrame(fetch_campaign_insights)
+                    fetch_df_flattened = fetch_insights_records(
+                        fetch_access_user,
+                        fetch_advertiser_id,
+                        "AUCTION_CAMPAIGN",
+                        FETCH_CAMPAIGN_DIMENSIONS,
+                        fetch_date_start,
+                        fetch_date_end
+                    )
                     fetch_sections_status[fetch_section_name] = "succeed"
                     print(f"✅ [FETCH] Successfully retrieved {len(fetch_df_flattened)} rows of TikTok Ads campaign insights.")
                     logging.info(f"✅ [FETCH] Successfully retrieved {len(fetch_df_flattened)} rows of TikTok Ads campaign insights.")
@@ -880,32 +820,43 @@ def fetch_campaign_insights(fetch_date_start: str, fetch_date_end: str) -> pd.Da
             fetch_cooldown_queued = 60 + 30 * max(0, fetch_attempt_queued)
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)                     
    
-    # 2.1.6. Trigger to enforce schema for TikTok Ads campaign insights
+    # 2.1.4. Trigger to enforce schema for TikTok Ads campaign insights
         fetch_section_name = "[FETCH] Trigger to enforce schema for TikTok Ads campaign insights"
         fetch_section_start = time.time()        
         try:            
-            print(f"🔄 [FETCH] Trigger to enforce schema for TiKTok Ads campaign insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
-            logging.info(f"🔄 [FETCH] Trigger to enforce schema for TiKTok Ads campaign insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
-            fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_campaign_insights")            
-            fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
-            fetch_status_enforced = fetch_results_schema["schema_status_final"]
-            fetch_df_enforced = fetch_results_schema["schema_df_final"]    
-            if fetch_status_enforced == "schema_succeed_all":
+            if not fetch_enforce_schema:
+                fetch_df_enforced = fetch_df_flattened
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped TikTok Ads campaign insights schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+                logging.info(f"⏭️ [FETCH] Skipped TikTok Ads campaign insights schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+            elif fetch_df_flattened.empty:
+                fetch_df_enforced = fetch_df_flattened
                 fetch_sections_status[fetch_section_name] = "succeed"
-                print(f"✅ [FETCH] Successfully triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-            elif fetch_status_enforced == "schema_succeed_partial":
-                fetch_sections_status[fetch_section_name] = "partial"
-                print(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"⚠️ [FETCH] Skipped TikTok Ads campaign insights schema enforcement as no rows were retrieved.")
+                logging.warning(f"⚠️ [FETCH] Skipped TikTok Ads campaign insights schema enforcement as no rows were retrieved.")
             else:
-                fetch_sections_status[fetch_section_name] = "failed"
-                print(f"❌ [FETCH] Failed to trigger TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"🔄 [FETCH] Trigger to enforce schema for TiKTok Ads campaign insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
+                logging.info(f"🔄 [FETCH] Trigger to enforce schema for TiKTok Ads campaign insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
+                fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_campaign_insights")            
+                fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
+                fetch_status_enforced = fetch_results_schema["schema_status_final"]
+                fetch_df_enforced = fetch_results_schema["schema_df_final"]    
+                if fetch_status_enforced == "schema_succeed_all":
+                    fetch_sections_status[fetch_section_name] = "succeed"
+                    print(f"✅ [FETCH] Successfully triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                elif fetch_status_enforced == "schema_succeed_partial":
+                    fetch_sections_status[fetch_section_name] = "partial"
+                    print(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                else:
+                    fetch_sections_status[fetch_section_name] = "failed"
+                    print(f"❌ [FETCH] Failed to trigger TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads campaign insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 2.1.7. Summarize fetch results for TikTok Ads campaign insights
+    # 2.1.5. Summarize fetch results for TikTok Ads campaign insights
     finally:
         fetch_time_elapsed = round(time.time() - fetch_time_start, 2)
         fetch_df_final = fetch_df_enforced.copy() if "fetch_df_enforced" in locals() and not fetch_df_enforced.empty else pd.DataFrame()
@@ -956,7 +907,7 @@ def fetch_campaign_insights(fetch_date_start: str, fetch_date_end: str) -> pd.Da
     return fetch_results_final
 
 # 2.2. Fetch ad insights for TikTok Ads    
-def fetch_ad_insights(fetch_date_start: str, fetch_date_end: str) -> pd.DataFrame:
+def fetch_ad_insights(fetch_date_start: str, fetch_date_end: str, fetch_enforce_schema: bool = True) -> pd.DataFrame:
     print(f"🚀 [FETCH] Starting to fetch TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end}...")
     logging.info(f"🚀 [FETCH] Starting to fetch TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end}...")       
 
@@ -970,124 +921,42 @@ def fetch_ad_insights(fetch_date_start: str, fetch_date_end: str) -> pd.DataFram
 
     try:
 
-    # 2.2.2. Initialize Google Secret Manager client
-        fetch_section_name = "[FETCH] Initialize Google Secret Manager client"
-        fetch_section_start = time.time()           
+    # 2.2.2. Get TikTok Ads credentials from Google Secret Manager
+        fetch_section_name = "[FETCH] Get TikTok Ads credentials from Google Secret Manager"
+        fetch_section_start = time.time()
         try:
-            print(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            logging.info(f"🔍 [FETCH] Initializing Google Secret Manager client for Google Cloud Platform project {PROJECT}...")
-            google_secret_client = secretmanager.SecretManagerServiceClient()
+            print(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token and advertiser_id for account {ACCOUNT} from Google Secret Manager...")
+            fetch_credentials = fetch_secret_credentials()
+            fetch_access_user = fetch_credentials["fetch_access_user"]
+            fetch_advertiser_id = fetch_credentials["fetch_advertiser_id"]
             fetch_sections_status[fetch_section_name] = "succeed"
-            print(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
-            logging.info(f"✅ [FETCH] Successfully initialized Google Secret Manager client for Google Cloud project {PROJECT}.")
+            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
+            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token and advertiser_id {fetch_advertiser_id} for account {ACCOUNT} from Google Secret Manager.")
         except Exception as e:
             fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to initialize Google Secret Manager client for Google Cloud Platform project {PROJECT} due to {e}.")
+            print(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
+            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads credentials for account {ACCOUNT} from Google Secret Manager due to {e}.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 2.2.3. Get TikTok Ads access token from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads access token from Google Secret Manager"
-        fetch_section_start = time.time()              
-        try: 
-            print(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads access token for account {ACCOUNT}...")
-            token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
-            token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
-            token_secret_response = google_secret_client.access_secret_version(request={"name": token_secret_name})
-            fetch_access_user = token_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads access token for account {ACCOUNT} from Google Secret Manager.")
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok access token for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 2.2.4. Get TikTok Ads advertiser_id from Google Secret Manager
-        fetch_section_name = "[FETCH] Get TikTok Ads advertiser_id from Google Secret Manager"
-        fetch_section_start = time.time()        
-        try:
-            print(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            logging.info(f"🔍 [FETCH] Retrieving TikTok Ads advertiser_id for account {ACCOUNT} from Google Secret Manager...")
-            advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
-            advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
-            advertiser_secret_response = google_secret_client.access_secret_version(request={"name": advertiser_secret_name})
-            fetch_advertiser_id = advertiser_secret_response.payload.data.decode("utf-8")
-            fetch_sections_status[fetch_section_name] = "succeed"            
-            print(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")
-            logging.info(f"✅ [FETCH] Successfully retrieved TikTok Ads advertiser_id {fetch_advertiser_id} from Google Secret Manager.")           
-        except Exception as e:
-            fetch_sections_status[fetch_section_name] = "failed"
-            print(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-            logging.error(f"❌ [FETCH] Failed to retrieve TikTok Ads advertiser_id for {ACCOUNT} from Google Secret Manager due to {e}.")
-        finally:
-            fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
-
-    # 2.2.5. Make TikTok Ads API call for ad insights
+    # 2.2.3. Make TikTok Ads API call for ad insights
         fetch_section_name = "[FETCH] Make TikTok Ads API call for ad insights"
         fetch_section_start = time.time()
         try:
             print(f"🔍 [FETCH] Retrieving TikTok Ads ad insights for advertiser_id {fetch_advertiser_id} from {fetch_date_start} to {fetch_date_end}..")
             logging.info(f"🔍 [FETCH] Retrieving TikTok Ads ad insights for advertiser_id {fetch_advertiser_id} from {fetch_date_start} to {fetch_date_end}..")
             fetch_attempts_queued = 2
-            fetch_ad_insights = []
-            fetch_ad_records = []     
-            fetch_ad_url = "https://business-api.tiktok.com/open_api/v1.3/report/integrated/get/"
-            fetch_ad_headers = {
-                "Access-Token": fetch_access_user,
-                "Content-Type": "application/json"
-            }             
-            fetch_ad_params = {
-                "advertiser_id": fetch_advertiser_id,
-                "report_type": "BASIC",
-                "data_level": "AUCTION_AD",
-                "dimensions": ["ad_id", "stat_time_day"],
-                "metrics": [
-                    "result",
-                    "spend",
-                    "impressions",
-                    "clicks",
-                    "engaged_view_15s",
-                    "purchase",
-                    "complete_payment",
-                    "onsite_total_purchase",
-                    "offline_shopping_events",
-                    "onsite_shopping",
-                    "messaging_total_conversation_tiktok_direct_message"
-                ],
-                "start_date": fetch_date_start,
-                "end_date": fetch_date_end,
-                "page_size": 1000,
-                "page": 1
-            }       
             for fetch_attempt_queued in range(fetch_attempts_queued):
                 try:
-                    while True:
-                        fetch_ad_response = requests.get(
-                            fetch_ad_url,
-                            headers=fetch_ad_headers,
-                            json=fetch_ad_params,
-                            timeout=60
-                        )
-                        fetch_ad_json = fetch_ad_response.json()                  
-                        if fetch_ad_json.get("code") != 0:
-                            raise Exception(f"❌ [FETCH] Failed to retrieve TikTok Ads ad-level insights with BASIC report_type due to API error {fetch_ad_json.get('message')}.")
-                        fetch_ad_batch = fetch_ad_json["data"].get("list", [])
-                        fetch_ad_records.extend(fetch_ad_batch)
-                        if len(fetch_ad_batch) < fetch_ad_params["page_size"]:
-                            break
-                        fetch_ad_params["page"] += 1
-                    for fetch_ad_record in fetch_ad_records:
-                        fetch_ad_insight = {}
-                        fetch_ad_insight.update(fetch_ad_record.get("dimensions", {}))
-                        fetch_ad_insight.update(fetch_ad_record.get("metrics", {}))
-                        fetch_ad_insight["advertiser_id"] = fetch_ad_params["advertiser_id"]
-                        fetch_ad_insights.append(fetch_ad_insight)
-                    fetch_df_flattened = pd.DataFrame(fetch_ad_insights)
+                    fetch_df_flattened = fetch_insights_records(
+                        fetch_access_user,
+                        fetch_advertiser_id,
+                        "AUCTION_AD",
+                        FETCH_AD_DIMENSIONS,
+                        fetch_date_start,
+                        fetch_date_end
+                    )
                     fetch_sections_status[fetch_section_name] = "succeed"
                     print(f"✅ [FETCH] Successfully retrieved {len(fetch_df_flattened)} rows of TikTok Ads ad insights.")
                     logging.info(f"✅ [FETCH] Successfully retrieved {len(fetch_df_flattened)} rows of TikTok Ads ad insights.")                    
@@ -1106,32 +975,43 @@ def fetch_ad_insights(fetch_date_start: str, fetch_date_end: str) -> pd.DataFram
             fetch_cooldown_queued = 60 + 30 * max(0, fetch_attempt_queued)
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)              
     
-    # 2.2.6. Trigger to enforce schema for TikTok Ads ad insights
+    # 2.2.4. Trigger to enforce schema for TikTok Ads ad insights
         fetch_section_name = "[FETCH] Trigger to enforce schema for TikTok Ads ad insights"
         fetch_section_start = time.time()        
         try:            
-            print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
-            logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
-            fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_insights")            
-            fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
-            fetch_status_enforced = fetch_results_schema["schema_status_final"]
-            fetch_df_enforced = fetch_results_schema["schema_df_final"]    
-            if fetch_status_enforced == "schema_succeed_all":
+            if not fetch_enforce_schema:
+                fetch_df_enforced = fetch_df_flattened
+                fetch_sections_status[fetch_section_name] = "skipped"
+                print(f"⏭️ [FETCH] Skipped TikTok Ads ad insights schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+                logging.info(f"⏭️ [FETCH] Skipped TikTok Ads ad insights schema enforcement with {len(fetch_df_enforced)} retrieved row(s) as requested by the caller.")
+            elif fetch_df_flattened.empty:
+                fetch_df_enforced = fetch_df_flattened
                 fetch_sections_status[fetch_section_name] = "succeed"
-                print(f"✅ [FETCH] Successfully triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-            elif fetch_status_enforced == "schema_succeed_partial":
-                fetch_sections_status[fetch_section_name] = "partial"
-                print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"⚠️ [FETCH] Skipped TikTok Ads ad insights schema enforcement as no rows were retrieved.")
+                logging.warning(f"⚠️ [FETCH] Skipped TikTok Ads ad insights schema enforcement as no rows were retrieved.")
             else:
-                fetch_sections_status[fetch_section_name] = "failed"
-                print(f"❌ [FETCH] Failed to trigger TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
-                logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                print(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
+                logging.info(f"🔄 [FETCH] Trigger to enforce schema for TikTok Ads ad insights from {fetch_date_start} to {fetch_date_end} with {len(fetch_df_flattened)} row(s)...")
+                fetch_results_schema = enforce_table_schema(fetch_df_flattened, "fetch_ad_insights")            
+                fetch_summary_enforced = fetch_results_schema["schema_summary_final"]
+                fetch_status_enforced = fetch_results_schema["schema_status_final"]
+                fetch_df_enforced = fetch_results_schema["schema_df_final"]    
+                if fetch_status_enforced == "schema_succeed_all":
+                    fetch_sections_status[fetch_section_name] = "succeed"
+                    print(f"✅ [FETCH] Successfully triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.info(f"✅ [FETCH] Successfully triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                elif fetch_status_enforced == "schema_succeed_partial":
+                    fetch_sections_status[fetch_section_name] = "partial"
+                    print(f"⚠️ [FETCH] Partially triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.warning(f"⚠️ [FETCH] Partially triggered TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                else:
+                    fetch_sections_status[fetch_section_name] = "failed"
+                    print(f"❌ [FETCH] Failed to trigger TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
+                    logging.error(f"❌ [FETCH] Failed to trigger TikTok Ads ad insights schema enforcement from {fetch_date_start} to {fetch_date_end} with {fetch_summary_enforced['schema_rows_output']}/{fetch_summary_enforced['schema_rows_input']} enforced row(s) in {fetch_summary_enforced['schema_time_elapsed']}s.")
         finally:
             fetch_sections_time[fetch_section_name] = round(time.time() - fetch_section_start, 2)
 
-    # 2.2.7. Summarize fetch results for TikTok Ads ad insights
+    # 2.2.5. Summarize fetch results for TikTok Ads ad insights
     finally:
         fetch_time_elapsed = round(time.time() - fetch_time_start, 2)
         fetch_df_final = fetch_df_enforced.copy() if "fetch_df_enforced" in locals() and not fetch_df_enforced.empty else pd.DataFrame()
@@ -1179,4 +1059,200 @@ def fetch_ad_insights(fetch_date_start: str, fetch_date_end: str) -> pd.DataFram
                 "fetch_rows_output": fetch_rows_output,
             },
         }
-    return fetch_results_final
\ No newline at end of file
+    return fetch_results_final
+
+# 3. FETCH GOOGLE SECRET MANAGER CREDENTIALS
+
+# 3.1. Get shared Google Secret Manager client
+def fetch_secret_client() -> secretmanager.SecretManagerServiceClient:
+    global FETCH_SECRET_CLIENT
+    if FETCH_SECRET_CLIENT is None:
+        with FETCH_SECRET_LOCK:
+            if FETCH_SECRET_CLIENT is None:
+                FETCH_SECRET_CLIENT = secretmanager.SecretManagerServiceClient()
+    return FETCH_SECRET_CLIENT
+
+# 3.2. Get fresh secret value from in-process cache
+def fetch_secret_cached(fetch_secret_name: str) -> str | None:
+    with FETCH_SECRET_LOCK:
+        fetch_secret_entry = FETCH_SECRET_CACHE.get(fetch_secret_name)
+    if fetch_secret_entry and time.time() - fetch_secret_entry[0] < FETCH_SECRET_TTL:
+        return fetch_secret_entry[1]
+    return None
+
+# 3.3. Get secret value from Google Secret Manager with in-process cache
+def fetch_secret_value(fetch_secret_name: str) -> str:
+    fetch_secret_payload = fetch_secret_cached(fetch_secret_name)
+    if fetch_secret_payload is not None:
+        return fetch_secret_payload
+    fetch_secret_response = fetch_secret_client().access_secret_version(request={"name": fetch_secret_name})
+    fetch_secret_payload = fetch_secret_response.payload.data.decode("utf-8")
+    with FETCH_SECRET_LOCK:
+        FETCH_SECRET_CACHE[fetch_secret_name] = (time.time(), fetch_secret_payload)
+    return fetch_secret_payload
+
+# 3.4. Get TikTok Ads access token and advertiser_id from Google Secret Manager
+def fetch_secret_credentials() -> dict:
+    token_secret_id = f"{COMPANY}_secret_all_{PLATFORM}_token_access_user"
+    token_secret_name = f"projects/{PROJECT}/secrets/{token_secret_id}/versions/latest"
+    advertiser_secret_id = f"{COMPANY}_secret_{DEPARTMENT}_tiktok_account_id_{ACCOUNT}"
+    advertiser_secret_name = f"projects/{PROJECT}/secrets/{advertiser_secret_id}/versions/latest"
+    fetch_secret_payloads = {
+        fetch_secret_name: fetch_secret_cached(fetch_secret_name)
+        for fetch_secret_name in (token_secret_name, advertiser_secret_name)
+    }
+    fetch_secret_missed = [fetch_secret_name for fetch_secret_name, fetch_secret_payload in fetch_secret_payloads.items() if fetch_secret_payload is None]
+    if len(fetch_secret_missed) > 1:
+        with ThreadPoolExecutor(max_workers=len(fetch_secret_missed)) as fetch_secret_executor:
+            fetch_secret_payloads.update(zip(fetch_secret_missed, fetch_secret_executor.map(fetch_secret_value, fetch_secret_missed)))
+    else:
+        for fetch_secret_name in fetch_secret_missed:
+            fetch_secret_payloads[fetch_secret_name] = fetch_secret_value(fetch_secret_name)
+    return {
+        "fetch_access_user": fetch_secret_payloads[token_secret_name],
+        "fetch_advertiser_id": fetch_secret_payloads[advertiser_secret_name],
+    }
+
+# 4. FETCH TIKTOK ADS METADATA RECORDS
+
+# 4.1. Fetch metadata records for a chunk of TikTok Ads campaign_id(s) or ad_id(s) with split retry on failure
+def fetch_metadata_chunk(fetch_metadata_url: str, fetch_metadata_headers: dict, fetch_advertiser_id: str, fetch_metadata_filter: str, fetch_metadata_chunk_ids: list[str], fetch_metadata_fields: list[str]) -> list[dict]:
+    fetch_metadata_chunk_records = []
+    try:
+        fetch_pagination_current = 1
+        fetch_pagination_continue = True
+        while fetch_pagination_continue:
+            fetch_metadata_payload = {
+                "advertiser_id": fetch_advertiser_id,
+                "filtering": {fetch_metadata_filter: fetch_metadata_chunk_ids},
+                "fields": fetch_metadata_fields,
+                "page": fetch_pagination_current,
+                "page_size": FETCH_METADATA_BATCH
+            }
+            fetch_metadata_json = fetch_api_request(
+                fetch_metadata_url,
+                fetch_metadata_headers,
+                fetch_metadata_payload
+            )
+            if fetch_metadata_json.get("code") != 0:
+                raise Exception(f"API error {fetch_metadata_json.get('message')}")
+            fetch_metadata_chunk_records.extend(fetch_metadata_json["data"].get("list", []))
+            fetch_pagination_total = fetch_metadata_json["data"].get("page_info", {}).get("total_page", 1)
+            fetch_pagination_continue = fetch_pagination_current < fetch_pagination_total
+            fetch_pagination_current += 1
+    except Exception as e:
+        if len(fetch_metadata_chunk_ids) == 1:
+            logging.warning(f"⚠️ [FETCH] Failed to retrieve TikTok Ads metadata for {fetch_metadata_filter} {fetch_metadata_chunk_ids} due to {e}.")
+            return []
+        fetch_metadata_split = len(fetch_metadata_chunk_ids) // 2
+        logging.warning(f"🔄 [FETCH] Splitting TikTok Ads metadata request for {len(fetch_metadata_chunk_ids)} {fetch_metadata_filter} starting from {fetch_metadata_chunk_ids[0]} due to {e}...")
+        return (
+            fetch_metadata_chunk(fetch_metadata_url, fetch_metadata_headers, fetch_advertiser_id, fetch_metadata_filter, fetch_metadata_chunk_ids[:fetch_metadata_split], fetch_metadata_fields)
+            + fetch_metadata_chunk(fetch_metadata_url, fetch_metadata_headers, fetch_advertiser_id, fetch_metadata_filter, fetch_metadata_chunk_ids[fetch_metadata_split:], fetch_metadata_fields)
+        )
+    return fetch_metadata_chunk_records
+
+# 5. FETCH TIKTOK ADS API REQUESTS
+
+# 5.1. Make TikTok Ads API request with capped backoff on rate limit codes
+def fetch_api_request(fetch_request_url: str, fetch_request_headers: dict, fetch_request_payload: dict) -> dict:
+    fetch_request_params = {
+        fetch_param_key: orjson.dumps(fetch_param_value).decode() if isinstance(fetch_param_value, (list, tuple, dict)) else fetch_param_value
+        for fetch_param_key, fetch_param_value in fetch_request_payload.items()
+    }
+    fetch_retry_waited = 0.0
+    for fetch_retry_attempt in range(FETCH_RETRY_ATTEMPTS):
+        fetch_rate_acquire()
+        fetch_request_response = FETCH_HTTP_SESSION.get(
+            fetch_request_url,
+            headers=fetch_request_headers,
+            params=fetch_request_params,
+            timeout=FETCH_HTTP_TIMEOUT
+        )
+        fetch_request_response.raise_for_status()
+        fetch_request_json = orjson.loads(fetch_request_response.content)
+        if fetch_request_json.get("code") not in FETCH_RETRY_CODES or fetch_retry_attempt == FETCH_RETRY_ATTEMPTS - 1:
+            return fetch_request_json
+        fetch_retry_delayed = min(2 ** fetch_retry_attempt, FETCH_RETRY_DELAY_MAX) + random.uniform(0, 0.5)
+        if fetch_retry_waited + fetch_retry_delayed > FETCH_RETRY_BUDGET:
+            return fetch_request_json
+        fetch_retry_waited += fetch_retry_delayed
+        logging.warning(f"🔄 [FETCH] Waiting {fetch_retry_delayed:.2f}s before retrying TikTok Ads API request to {fetch_request_url} due to rate limit code {fetch_request_json.get('code')}...")
+        time.sleep(fetch_retry_delayed)
+
+# 5.2. Get a single TikTok Ads report page for insights fetching
+def fetch_insights_page(fetch_insights_url: str, fetch_insights_headers: dict, fetch_insights_params: dict) -> dict:
+    fetch_insights_json = fetch_api_request(fetch_insights_url, fetch_insights_headers, fetch_insights_params)
+    if fetch_insights_json.get("code") != 0:
+        raise Exception(f"❌ [FETCH] Failed to retrieve TikTok Ads {fetch_insights_params['data_level']} insights page {fetch_insights_params['page']} due to API error {fetch_insights_json.get('message')}.")
+    return fetch_insights_json
+
+# 5.3. Get TikTok Ads advertiser_name with in-process cache
+def fetch_advertiser_info(fetch_access_user: str, fetch_advertiser_id: str) -> str:
+    fetch_advertiser_cached = FETCH_ADVERTISER_CACHE.get(fetch_advertiser_id)
+    if fetch_advertiser_cached and time.time() - fetch_advertiser_cached[0] < FETCH_ADVERTISER_TTL:
+        return fetch_advertiser_cached[1]
+    fetch_advertiser_url = "https://business-api.tiktok.com/open_api/v1.3/advertiser/info/"
+    fetch_advertiser_headers = {
+        "Access-Token": fetch_access_user
+    }
+    fetch_advertiser_payload = {"advertiser_ids": [fetch_advertiser_id]}
+    fetch_advertiser_json = fetch_api_request(
+        fetch_advertiser_url, 
+        fetch_advertiser_headers, 
+        fetch_advertiser_payload
+    )
+    fetch_advertiser_name = fetch_advertiser_json["data"]["list"][0]["name"]
+    FETCH_ADVERTISER_CACHE[fetch_advertiser_id] = (time.time(), fetch_advertiser_name)
+    return fetch_advertiser_name
+
+# 5.4. Acquire a token from the shared TikTok Ads API rate limiter
+def fetch_rate_acquire() -> None:
+    with FETCH_RATE_LOCK:
+        fetch_rate_now = time.monotonic()
+        fetch_rate_tokens = min(
+            float(FETCH_RATE_PER_SECOND),
+            FETCH_RATE_BUCKET["tokens"] + (fetch_rate_now - FETCH_RATE_BUCKET["updated"]) * FETCH_RATE_PER_SECOND
+        )
+        fetch_rate_delayed = max(0.0, (1 - fetch_rate_tokens) / FETCH_RATE_PER_SECOND)
+        FETCH_RATE_BUCKET["tokens"] = fetch_rate_tokens - 1
+        FETCH_RATE_BUCKET["updated"] = fetch_rate_now
+    if fetch_rate_delayed:
+        time.sleep(fetch_rate_delayed)
+
+# 6. FETCH TIKTOK ADS INSIGHTS RECORDS
+
+# 6.1. Fetch all report pages for TikTok Ads insights into a flattened DataFrame
+def fetch_insights_records(fetch_access_user: str, fetch_advertiser_id: str, fetch_data_level: str, fetch_insights_dimensions: tuple[str, ...], fetch_date_start: str, fetch_date_end: str) -> pd.DataFrame:
+    fetch_insights_headers = {
+        "Access-Token": fetch_access_user
+    }
+    fetch_insights_params = {
+        **FETCH_INSIGHTS_PARAMS,
+        "advertiser_id": fetch_advertiser_id,
+        "data_level": fetch_data_level,
+        "dimensions": fetch_insights_dimensions,
+        "start_date": fetch_date_start,
+        "end_date": fetch_date_end,
+        "page": 1
+    }
+    fetch_insights_columns = {fetch_column_name: [] for fetch_column_name in fetch_insights_params["dimensions"] + fetch_insights_params["metrics"]}
+    fetch_insights_pages = [fetch_insights_page(FETCH_INSIGHTS_URL, fetch_insights_headers, fetch_insights_params)]
+    fetch_pagination_total = fetch_insights_pages[0]["data"].get("page_info", {}).get("total_page", 1)
+    with ThreadPoolExecutor(max_workers=FETCH_INSIGHTS_WORKERS) as fetch_insights_executor:
+        fetch_insights_pages.extend(fetch_insights_executor.map(
+            lambda fetch_pagination_current: fetch_insights_page(FETCH_INSIGHTS_URL, fetch_insights_headers, {**fetch_insights_params, "page": fetch_pagination_current}),
+            range(2, fetch_pagination_total + 1)
+        ))
+    for fetch_insights_json in fetch_insights_pages:
+        for fetch_insights_record in fetch_insights_json["data"].get("list", []):
+            fetch_record_dimensions = fetch_insights_record.get("dimensions", {})
+            fetch_record_metrics = fetch_insights_record.get("metrics", {})
+            for fetch_column_name in fetch_insights_params["dimensions"]:
+                fetch_insights_columns[fetch_column_name].append(fetch_record_dimensions.get(fetch_column_name))
+            for fetch_column_name in fetch_insights_params["metrics"]:
+                fetch_insights_columns[fetch_column_name].append(fetch_record_metrics.get(fetch_column_name))
+    if not fetch_insights_columns[fetch_insights_dimensions[0]]:
+        return pd.DataFrame()
+    fetch_insights_columns["advertiser_id"] = [fetch_advertiser_id] * len(fetch_insights_columns[fetch_insights_dimensions[0]])
+    return pd.DataFrame(fetch_insights_columns)
@@ -41,6 +41,250 @@ from zoneinfo import ZoneInfo
 # Add Python Pandas libraries for integration
 import pandas as pd
 
+# Define schema mapping for TikTok Ads data types shared across schema enforcement calls
+SCHEMA_TYPES_MAPPING = {
+    "fetch_campaign_metadata": {
+        "advertiser_id": str,
+        "advertiser_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "operation_status": str,
+        "objective_type": str,       
+        "create_time": "datetime64[ns, UTC]"
+    },
+    "fetch_ad_metadata": {
+        "advertiser_id": str,
+        "ad_id": str,
+        "ad_name": str,
+        "adgroup_id": str,
+        "adgroup_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "operation_status": str,
+        "create_time": "datetime64[ns, UTC]",
+        "ad_format": str,
+        "optimization_event": str,
+        "video_id": str
+    },
+    "fetch_ad_creative": {
+        "advertiser_id": str,
+        "video_id": str,
+        "video_cover_url": str,
+        "preview_url": str,
+        "create_time": "datetime64[ns, UTC]"
+    },
+    "fetch_campaign_insights": {
+        "advertiser_id": str,
+        "campaign_id": str,
+        "stat_time_day": str,
+        "result": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int
+    },
+    "fetch_ad_insights": {
+        "advertiser_id": str,
+        "ad_id": str,
+        "stat_time_day": str,
+        "result": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int
+    },
+    "ingest_campaign_metadata": {
+        "advertiser_id": str,
+        "advertiser_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "operation_status": str,
+        "objective_type": str,        
+        "create_time": "datetime64[ns, UTC]"
+    },
+    "ingest_ad_metadata": {
+        "advertiser_id": str,
+        "ad_id": str,
+        "ad_name": str,
+        "adgroup_id": str,
+        "adgroup_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "operation_status": str,
+        "create_time": "datetime64[ns, UTC]",
+        "ad_format": str,
+        "optimization_event": str,
+        "video_id": str
+    },
+    "ingest_ad_creative": {
+        "advertiser_id": str,
+        "video_id": str,
+        "video_cover_url": str,
+        "preview_url": str,
+        "create_time": "datetime64[ns, UTC]"
+    },
+    "ingest_campaign_insights": {
+        "advertiser_id": str,
+        "campaign_id": str,
+        "result": str,
+        "stat_time_day": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int,
+    },
+    "ingest_ad_insights": {
+        "advertiser_id": str,
+        "ad_id": str,        
+        "result": str,
+        "stat_time_day": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int,
+    },
+    "staging_campaign_insights": {
+        
+        # Original staging ad fields
+        "account_id": str,
+        "account_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "delivery_status": str,
+        "objective_type": str,
+        "result": str,
+        "date_start": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int,
+        
+        # Enriched dimensions from campaign_name and specific to campaign settings
+        "enrich_campaign_objective": str,
+        "enrich_campaign_region": str,
+        "enrich_campaign_personnel": str,            
+        
+        # Enriched dimensions from campaign_name and specific to budget classfication
+        "enrich_budget_group": str,
+        "enrich_budget_type": str,            
+        
+        # Enriched dimensions from campaign_name and specific to category classification
+        "enrich_category_group": str,            
+        
+        # Enriched dimensions from campaign_name and specific to advertising strategy
+        "enrich_program_track": str,
+        "enrich_program_group": str,
+        "enrich_program_type": str,            
+        
+        # Standardized time columns
+        "date": "datetime64[ns, UTC]",
+        "year": str,
+        "month": str,
+        "last_updated_at": "datetime64[ns, UTC]",            
+        
+        # Enriched dimensions from table_id and specific to internal company structure
+        "enrich_account_platform": str,
+        "enrich_account_department": str,
+        "enrich_account_name": str
+    },
+    "staging_ad_insights": {
+        
+        # Original staging ad fields            
+        "account_id": str,
+        "ad_id": str,
+        "ad_name": str,
+        "adset_id": str,
+        "adset_name": str,
+        "campaign_id": str,
+        "campaign_name": str,
+        "date_start": str,
+        "delivery_status": str,
+        "ad_format": str,
+        "video_id": str,
+        "video_cover_url": str,
+        "preview_url": str,
+        "optimization_event": str,
+        "result": str,
+        "spend": float,
+        "impressions": int,
+        "clicks": int,
+        "engaged_view_15s": int,
+        "purchase": int,
+        "complete_payment": int,
+        "onsite_total_purchase": int,
+        "offline_shopping_events": int,
+        "onsite_shopping": int,
+        "messaging_total_conversation_tiktok_direct_message": int,
+        
+        # Enriched dimensions from campaign_name and specific to campaign settings
+        "enrich_campaign_objective": str,
+        "enrich_campaign_region": str,
+        "enrich_campaign_personnel": str,            
+        
+        # Enriched dimensions from campaign_name and specific to budget classfication
+        "enrich_budget_group": str,
+        "enrich_budget_type": str,            
+        
+        # Enriched dimensions from campaign_name and specific to category classification
+        "enrich_category_group": str,            
+        
+        # Enriched dimensions from campaign_name and specific to advertising strategy
+        "enrich_program_track": str,
+        "enrich_program_group": str,
+        "enrich_program_type": str,            
+        
+        # Enriched dimensions from adset_name and specific to advertising strategy
+        "enrich_adset_strategy": str,
+        "enrich_adset_subtype": str,            
+        
+        # Enriched dimensions from adset_name and specific to targeting
+        "enrich_adset_location": str,
+        "enrich_adset_audience": str,
+        "enrich_adset_format": str,            
+        
+        # Enriched dimensions from table_id and specific to internal company structure
+        "enrich_account_platform": str,
+        "enrich_account_department": str,
+        "enrich_account_name": str,            
+        
+        # Standardized time columns
+        "date": "datetime64[ns, UTC]",
+        "year": str,
+        "month": str,
+        "last_updated_at": "datetime64[ns, UTC]"
+    }
+}
+
 # 1. ENSURE SCHEMA FOR GIVEN PYTHON DATAFRAME
 
 # 1.1. Enforce that the given DataFrame contains all required columns with correct datatypes
@@ -57,248 +301,7 @@ def enforce_table_schema(schema_df_input: pd.DataFrame, schema_type_mapping: str
     # 1.1.2. Define schema mapping for TikTk Ads data type
     schema_section_name = "[SCHEMA] Define schema mapping for TikTk Ads data type"
     schema_section_start = time.time()    
-    schema_types_mapping = {
-        "fetch_campaign_metadata": {
-            "advertiser_id": str,
-            "advertiser_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "operation_status": str,
-            "objective_type": str,       
-            "create_time": "datetime64[ns, UTC]"
-        },
-        "fetch_ad_metadata": {
-            "advertiser_id": str,
-            "ad_id": str,
-            "ad_name": str,
-            "adgroup_id": str,
-            "adgroup_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "operation_status": str,
-            "create_time": "datetime64[ns, UTC]",
-            "ad_format": str,
-            "optimization_event": str,
-            "video_id": str
-        },
-        "fetch_ad_creative": {
-            "advertiser_id": str,
-            "video_id": str,
-            "video_cover_url": str,
-            "preview_url": str,
-            "create_time": "datetime64[ns, UTC]"
-        },
-        "fetch_campaign_insights": {
-            "advertiser_id": str,
-            "campaign_id": str,
-            "stat_time_day": str,
-            "result": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int
-        },
-        "fetch_ad_insights": {
-            "advertiser_id": str,
-            "ad_id": str,
-            "stat_time_day": str,
-            "result": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int
-        },
-        "ingest_campaign_metadata": {
-            "advertiser_id": str,
-            "advertiser_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "operation_status": str,
-            "objective_type": str,        
-            "create_time": "datetime64[ns, UTC]"
-        },
-        "ingest_ad_metadata": {
-            "advertiser_id": str,
-            "ad_id": str,
-            "ad_name": str,
-            "adgroup_id": str,
-            "adgroup_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "operation_status": str,
-            "create_time": "datetime64[ns, UTC]",
-            "ad_format": str,
-            "optimization_event": str,
-            "video_id": str
-        },
-        "ingest_ad_creative": {
-            "advertiser_id": str,
-            "video_id": str,
-            "video_cover_url": str,
-            "preview_url": str,
-            "create_time": "datetime64[ns, UTC]"
-        },
-        "ingest_campaign_insights": {
-            "advertiser_id": str,
-            "campaign_id": str,
-            "result": str,
-            "stat_time_day": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int,
-        },
-        "ingest_ad_insights": {
-            "advertiser_id": str,
-            "ad_id": str,        
-            "result": str,
-            "stat_time_day": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int,
-        },
-        "staging_campaign_insights": {
-            
-            # Original staging ad fields
-            "account_id": str,
-            "account_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "delivery_status": str,
-            "objective_type": str,
-            "result": str,
-            "date_start": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int,
-            
-            # Enriched dimensions from campaign_name and specific to campaign settings
-            "enrich_campaign_objective": str,
-            "enrich_campaign_region": str,
-            "enrich_campaign_personnel": str,            
-            
-            # Enriched dimensions from campaign_name and specific to budget classfication
-            "enrich_budget_group": str,
-            "enrich_budget_type": str,            
-            
-            # Enriched dimensions from campaign_name and specific to category classification
-            "enrich_category_group": str,            
-            
-            # Enriched dimensions from campaign_name and specific to advertising strategy
-            "enrich_program_track": str,
-            "enrich_program_group": str,
-            "enrich_program_type": str,            
-            
-            # Standardized time columns
-            "date": "datetime64[ns, UTC]",
-            "year": str,
-            "month": str,
-            "last_updated_at": "datetime64[ns, UTC]",            
-            
-            # Enriched dimensions from table_id and specific to internal company structure
-            "enrich_account_platform": str,
-            "enrich_account_department": str,
-            "enrich_account_name": str
-        },
-        "staging_ad_insights": {
-            
-            # Original staging ad fields            
-            "account_id": str,
-            "ad_id": str,
-            "ad_name": str,
-            "adset_id": str,
-            "adset_name": str,
-            "campaign_id": str,
-            "campaign_name": str,
-            "date_start": str,
-            "delivery_status": str,
-            "ad_format": str,
-            "video_id": str,
-            "video_cover_url": str,
-            "preview_url": str,
-            "optimization_event": str,
-            "result": str,
-            "spend": float,
-            "impressions": int,
-            "clicks": int,
-            "engaged_view_15s": int,
-            "purchase": int,
-            "complete_payment": int,
-            "onsite_total_purchase": int,
-            "offline_shopping_events": int,
-            "onsite_shopping": int,
-            "messaging_total_conversation_tiktok_direct_message": int,
-            
-            # Enriched dimensions from campaign_name and specific to campaign settings
-            "enrich_campaign_objective": str,
-            "enrich_campaign_region": str,
-            "enrich_campaign_personnel": str,            
-            
-            # Enriched dimensions from campaign_name and specific to budget classfication
-            "enrich_budget_group": str,
-            "enrich_budget_type": str,            
-            
-            # Enriched dimensions from campaign_name and specific to category classification
-            "enrich_category_group": str,            
-            
-            # Enriched dimensions from campaign_name and specific to advertising strategy
-            "enrich_program_track": str,
-            "enrich_program_group": str,
-            "enrich_program_type": str,            
-            
-            # Enriched dimensions from adset_name and specific to advertising strategy
-            "enrich_adset_strategy": str,
-            "enrich_adset_subtype": str,            
-            
-            # Enriched dimensions from adset_name and specific to targeting
-            "enrich_adset_location": str,
-            "enrich_adset_audience": str,
-            "enrich_adset_format": str,            
-            
-            # Enriched dimensions from table_id and specific to internal company structure
-            "enrich_account_platform": str,
-            "enrich_account_department": str,
-            "enrich_account_name": str,            
-            
-            # Standardized time columns
-            "date": "datetime64[ns, UTC]",
-            "year": str,
-            "month": str,
-            "last_updated_at": "datetime64[ns, UTC]"
-        }
-    }
+    schema_types_mapping = SCHEMA_TYPES_MAPPING
     schema_sections_status[schema_section_name] = "succeed"
     schema_sections_time[schema_section_name] = round(time.time() - schema_section_start, 2)
     
@@ -332,14 +335,10 @@ def enforce_table_schema(schema_df_input: pd.DataFrame, schema_type_mapping: str
                     schema_df_enforced[schema_column_expected] = pd.NA               
                 try:
                     if schema_data_type == int:
-                        schema_df_enforced[schema_column_expected] = pd.to_numeric(
-                            schema_df_enforced[schema_column_expected].astype(str).str.replace(",", "."), errors="coerce"
-                        ).fillna(0).astype(int)
+                        schema_df_enforced[schema_column_expected] = schema_numeric_values(schema_df_enforced[schema_column_expected]).fillna(0).astype(int)
 
                     elif schema_data_type == float:
-                        schema_df_enforced[schema_column_expected] = pd.to_numeric(
-                            schema_df_enforced[schema_column_expected].astype(str).str.replace(",", "."), errors="coerce"
-                        ).fillna(0.0).astype(float)
+                        schema_df_enforced[schema_column_expected] = schema_numeric_values(schema_df_enforced[schema_column_expected]).fillna(0.0).astype(float)
                     elif schema_data_type == "datetime64[ns, UTC]":
                         schema_df_enforced[schema_column_expected] = pd.to_datetime(
                             schema_df_enforced[schema_column_expected], errors="coerce", utc=True
@@ -407,4 +406,21 @@ def enforce_table_schema(schema_df_input: pd.DataFrame, schema_type_mapping: str
                 "schema_rows_output": schema_rows_output,
             },
         }    
-    return schema_results_final
\ No newline at end of file
+    return schema_results_final
+
+# 2. COERCE VALUES FOR GIVEN PYTHON SERIES
+
+# 2.1. Coerce the given Series to numeric values with comma decimal fallback
+def schema_numeric_values(schema_series_input: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(schema_series_input):
+        return pd.to_numeric(schema_series_input.astype(str).str.replace(",", "."), errors="coerce")
+    if pd.api.types.is_numeric_dtype(schema_series_input):
+        return schema_series_input
+    schema_series_numeric = pd.to_numeric(schema_series_input, errors="coerce")
+    schema_series_unparsed = schema_series_numeric.isna() & schema_series_input.notna()
+    if schema_series_unparsed.any():
+        schema_series_numeric = schema_series_numeric.astype(float)
+        schema_series_numeric[schema_series_unparsed] = pd.to_numeric(
+            schema_series_input[schema_series_unparsed].astype(str).str.replace(",", "."), errors="coerce"
+        )
+    return schema_series_numeric